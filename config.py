@@ -22,6 +22,9 @@ COMPANY_ID = os.environ.get('TIMR_COMPANY_ID', 'ohrnerit')
 # API base URL
 API_BASE_URL = "https://api.timr.com/v0.2"
 
+# API request timeout in seconds as (connect, read), so a hung response can't block forever
+API_TIMEOUT = (3.05, 10)
+
 # Date and time formats (for UI display and user input parsing only)
 # Note: API communication uses ISO 8601 format with timezone offset
 DATE_FORMAT = "%Y-%m-%d"
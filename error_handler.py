@@ -34,7 +34,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorContext:
     """Context information for enhanced error logging."""
     category: ErrorCategory
@@ -51,12 +51,30 @@ class ErrorContext:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            # Frozen dataclass: bypass __setattr__ to fill in the default
+            object.__setattr__(self, "timestamp", datetime.now().isoformat())
 
 
 class EnhancedErrorHandler:
     """Enhanced error handler with structured logging and categorization."""
     
+    # Lookup sets for _should_include_stacktrace
+    _STACKTRACE_SEVERITIES = frozenset({ErrorSeverity.CRITICAL, ErrorSeverity.HIGH})
+    _ALWAYS_STACKTRACE_CATEGORIES = frozenset({
+        ErrorCategory.SYSTEM, ErrorCategory.NETWORK, ErrorCategory.AUTHORIZATION
+    })
+    _NEVER_STACKTRACE_CATEGORIES = frozenset({
+        ErrorCategory.TIMR_BUSINESS_RULE, ErrorCategory.DATA_VALIDATION, ErrorCategory.AUTHENTICATION
+    })
+    
+    # Logging level used for each error severity
+    _SEVERITY_LOG_LEVELS = {
+        ErrorSeverity.CRITICAL: logging.CRITICAL,
+        ErrorSeverity.HIGH: logging.ERROR,
+        ErrorSeverity.MEDIUM: logging.WARNING,
+        ErrorSeverity.LOW: logging.INFO,
+    }
+    
     def __init__(self, logger_name: str):
         self.logger = logging.getLogger(logger_name)
         
@@ -112,6 +130,11 @@ class EnhancedErrorHandler:
         Returns:
             str: User-friendly error message
         """
+        # Skip building the log record entirely if nobody would see it
+        level = self._SEVERITY_LOG_LEVELS[context.severity]
+        if not self.logger.isEnabledFor(level):
+            return self._get_user_message(context, error)
+        
         # Create structured log entry
         log_entry = {
             "error_category": context.category.value,
@@ -194,14 +217,14 @@ class EnhancedErrorHandler:
         if include_stacktrace is None:
             include_stacktrace = self._should_include_stacktrace(context)
         
-        if context.severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(log_message, extra=log_entry, exc_info=include_stacktrace)
-        elif context.severity == ErrorSeverity.HIGH:
-            self.logger.error(log_message, extra=log_entry, exc_info=include_stacktrace)
-        elif context.severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(log_message, extra=log_entry, exc_info=include_stacktrace)
-        else:
-            self.logger.info(log_message, extra=log_entry, exc_info=include_stacktrace if context.severity != ErrorSeverity.LOW else False)
+        # Low severity errors are logged without stacktrace; formatting is left to the handlers
+        if context.severity == ErrorSeverity.LOW:
+            include_stacktrace = False
+        exc_info = False
+        if include_stacktrace:
+            # Callers may pass a new exception that was never raised; use the one being handled then
+            exc_info = error if error.__traceback__ is not None else True
+        self.logger.log(level, log_message, extra=log_entry, exc_info=exc_info)
         
         # Return user-friendly message
         return self._get_user_message(context, error)
@@ -421,7 +444,8 @@ class EnhancedErrorHandler:
         
         return str(response)
     
-    def _should_include_stacktrace(self, context: ErrorContext) -> bool:
+    @staticmethod
+    def _should_include_stacktrace(context: ErrorContext) -> bool:
         """
         Determine whether to include a stacktrace based on error context.
         
@@ -443,43 +467,23 @@ class EnhancedErrorHandler:
             bool: True if stacktrace should be included
         """
         # Always include stacktraces for critical and high severity issues
-        if context.severity in [ErrorSeverity.CRITICAL, ErrorSeverity.HIGH]:
-            return True
-        
-        # Always include for system errors (unexpected application issues)
-        if context.category == ErrorCategory.SYSTEM:
-            return True
-        
-        # Include for server-side API errors (5xx status codes)
-        if (context.category == ErrorCategory.TIMR_API_ERROR and 
-            context.api_status_code and context.api_status_code >= 500):
+        if context.severity in EnhancedErrorHandler._STACKTRACE_SEVERITIES:
             return True
         
-        # Exclude for client-side API errors (4xx status codes) unless high severity
-        if (context.category == ErrorCategory.TIMR_API_ERROR and 
-            context.api_status_code and 400 <= context.api_status_code < 500 and
-            context.severity not in [ErrorSeverity.CRITICAL, ErrorSeverity.HIGH]):
-            return False
-        
-        # Include for network errors (connection issues need debugging)
-        if context.category == ErrorCategory.NETWORK:
+        # System, network and authorization errors always need debugging info
+        if context.category in EnhancedErrorHandler._ALWAYS_STACKTRACE_CATEGORIES:
             return True
         
-        # Exclude for expected business rule violations
-        if context.category == ErrorCategory.TIMR_BUSINESS_RULE:
-            return False
-        
-        # Exclude for simple validation errors  
-        if context.category == ErrorCategory.DATA_VALIDATION:
-            return False
-        
-        # Exclude for authentication issues (usually expected when sessions expire)
-        if context.category == ErrorCategory.AUTHENTICATION:
+        # Business rule violations, validation and authentication errors are expected
+        if context.category in EnhancedErrorHandler._NEVER_STACKTRACE_CATEGORIES:
             return False
         
-        # Include for authorization issues (might indicate configuration problems)
-        if context.category == ErrorCategory.AUTHORIZATION:
-            return True
+        # Include for server-side API errors (5xx), exclude for client-side ones (4xx)
+        if context.category == ErrorCategory.TIMR_API_ERROR and context.api_status_code:
+            if context.api_status_code >= 500:
+                return True
+            if 400 <= context.api_status_code < 500:
+                return False
         
         # Default: include stacktrace for medium severity and above
         return context.severity != ErrorSeverity.LOW
@@ -5,11 +5,6 @@ Tests that ongoing working times cannot be edited or deleted.
 
 import unittest
 from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 class TestOngoingWorkingTimeProtection(unittest.TestCase):
     """Test protection against editing/deleting ongoing working times"""
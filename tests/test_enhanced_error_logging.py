@@ -23,28 +23,35 @@ from timr_api import TimrApi, TimrApiError
 class TestEnhancedRequestLogging(unittest.TestCase):
     """Test enhanced request/response logging functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Install one capture handler for the lifetime of the class."""
         # Create a test logger with string capture
-        self.log_capture_string = StringIO()
-        self.log_handler = logging.StreamHandler(self.log_capture_string)
+        cls.log_capture_string = StringIO()
+        cls.log_handler = logging.StreamHandler(cls.log_capture_string)
         
         # Use a formatter that captures the full message
         formatter = logging.Formatter('%(levelname)s:%(name)s:%(message)s')
-        self.log_handler.setFormatter(formatter)
+        cls.log_handler.setFormatter(formatter)
         
-        self.test_logger = logging.getLogger('test_enhanced_logging')
-        self.test_logger.addHandler(self.log_handler)
-        self.test_logger.setLevel(logging.DEBUG)
+        cls.test_logger = logging.getLogger('test_enhanced_logging')
+        cls.test_logger.addHandler(cls.log_handler)
+        cls.test_logger.setLevel(logging.DEBUG)
         
         # Create error handler with test logger
-        self.error_handler = EnhancedErrorHandler('test_enhanced_logging')
-        self.error_handler.logger = self.test_logger
+        cls.error_handler = EnhancedErrorHandler('test_enhanced_logging')
+        cls.error_handler.logger = cls.test_logger
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.test_logger.removeHandler(self.log_handler)
-        self.log_handler.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the capture handler."""
+        cls.test_logger.removeHandler(cls.log_handler)
+        cls.log_handler.close()
+    
+    def setUp(self):
+        """Start each test with an empty capture buffer."""
+        self.log_capture_string.seek(0)
+        self.log_capture_string.truncate(0)
     
     def test_enhanced_request_data_logging(self):
         """Test that enhanced request data is properly logged for API errors."""
@@ -289,29 +296,32 @@ class TestEnhancedRequestLogging(unittest.TestCase):
 class TestTimrApiEnhancedErrorLogging(unittest.TestCase):
     """Test that TimrApi properly creates enhanced request data for error logging."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Attach one capture handler to the timr_api logger for the class."""
+        cls.log_capture_string = StringIO()
+        cls.log_handler = logging.StreamHandler(cls.log_capture_string)
+        formatter = logging.Formatter('%(levelname)s:%(name)s:%(message)s')
+        cls.log_handler.setFormatter(formatter)
+        
+        # Attach to timr_api logger
+        cls.timr_api_logger = logging.getLogger('timr_api')
+        cls.timr_api_logger.addHandler(cls.log_handler)
+        cls.timr_api_logger.setLevel(logging.DEBUG)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the capture handler."""
+        cls.timr_api_logger.removeHandler(cls.log_handler)
+        cls.log_handler.close()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.timr_api = TimrApi()
         self.timr_api.user = {"id": "test_user_123"}
         
-        # Set up log capture
-        self.log_capture_string = StringIO()
-        self.log_handler = logging.StreamHandler(self.log_capture_string)
-        formatter = logging.Formatter('%(levelname)s:%(name)s:%(message)s')
-        self.log_handler.setFormatter(formatter)
-        
-        # Attach to timr_api logger
-        timr_api_logger = logging.getLogger('timr_api')
-        timr_api_logger.addHandler(self.log_handler)
-        timr_api_logger.setLevel(logging.DEBUG)
-        
-        self.original_handlers = timr_api_logger.handlers[:]
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        timr_api_logger = logging.getLogger('timr_api')
-        timr_api_logger.removeHandler(self.log_handler)
-        self.log_handler.close()
+        self.log_capture_string.seek(0)
+        self.log_capture_string.truncate(0)
     
     @patch('timr_api.requests.Session.request')
     def test_http_error_creates_enhanced_request_data(self, mock_request):
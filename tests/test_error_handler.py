@@ -7,10 +7,13 @@ Licensed under the MIT License
 """
 
 import unittest
-import json
 import logging
+import os
+import traceback
+import importlib.util
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
+import requests
 from requests.exceptions import HTTPError, ConnectionError, Timeout
 
 from error_handler import (
@@ -19,22 +22,35 @@ from error_handler import (
 )
 from timr_api import TimrApi, TimrApiError
 
+# Flask app tests are the slowest part of this module; allow skipping them
+# for fast iteration on the error handler itself
+APP_TESTS_ENABLED = (os.environ.get("SKIP_APP_TESTS") != "1"
+                     and importlib.util.find_spec("flask") is not None)
+
+# (API error message, HTTP status, substring expected in the user message)
+BUSINESS_RULE_ERRORS = [
+    ("Task is not bookable", 400, "bookable"),
+    ("Working time is frozen", 409, "frozen"),
+]
+
 
 class TestEnhancedErrorHandler(unittest.TestCase):
     """Test the enhanced error handler functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the error handler once; tests never mutate its state."""
+        cls.test_logger = logging.getLogger('test_error_handler')
+        cls.test_logger.setLevel(logging.DEBUG)
+        
+        cls.error_handler = EnhancedErrorHandler('test_error_handler')
+        cls.error_handler.logger = cls.test_logger
+    
     def setUp(self):
-        """Set up test fixtures."""
-        # Create a test logger with string capture
+        """Set up a fresh log capture for each test."""
         self.log_capture_string = StringIO()
         self.log_handler = logging.StreamHandler(self.log_capture_string)
-        self.test_logger = logging.getLogger('test_error_handler')
         self.test_logger.addHandler(self.log_handler)
-        self.test_logger.setLevel(logging.DEBUG)
-        
-        # Create error handler with test logger
-        self.error_handler = EnhancedErrorHandler('test_error_handler')
-        self.error_handler.logger = self.test_logger
     
     def tearDown(self):
         """Clean up test fixtures."""
@@ -115,6 +131,23 @@ class TestEnhancedErrorHandler(unittest.TestCase):
         self.assertIn("duration_minutes", log_contents)
         self.assertIn("test_user_123", log_contents)
     
+    def test_log_error_skipped_when_level_disabled(self):
+        """Test that nothing is logged, but a user message is still returned, below the logger level."""
+        quiet_handler = EnhancedErrorHandler('test_error_handler_quiet')
+        quiet_handler.logger = Mock(spec=logging.Logger)
+        quiet_handler.logger.isEnabledFor.return_value = False
+
+        user_message = quiet_handler.log_validation_error(
+            field="duration_minutes",
+            value=-5,
+            reason="must be positive",
+            user_id="test_user_123"
+        )
+
+        self.assertIn("duration", user_message.lower())
+        quiet_handler.logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        self.assertEqual(len(quiet_handler.logger.method_calls), 1)
+
     def test_sanitize_request_data(self):
         """Test that sensitive data is properly sanitized."""
         test_data = {
@@ -214,6 +247,24 @@ class TestTimrApiErrorHandling(unittest.TestCase):
         self.assertIsInstance(api_error.get_technical_message(), str)
         self.assertEqual(api_error.status_code, 500)
     
+    @patch('timr_api.requests.Session.request')
+    def test_server_error_logs_original_traceback(self, mock_request):
+        """Test that a 5xx response is logged with the traceback of the HTTPError raised for it."""
+        server_error = requests.Response()
+        server_error.status_code = 500
+        server_error.url = "https://example.invalid/test"
+        mock_request.return_value = server_error
+        
+        with self.assertLogs(timr_api_error_handler.logger, level=logging.ERROR) as captured, \
+                self.assertRaises(TimrApiError):
+            self.timr_api._request("GET", "/test")
+        
+        record = captured.records[-1]
+        self.assertIsNotNone(record.exc_info)
+        self.assertIs(record.exc_info[0], HTTPError)
+        self.assertIn("raise_for_status",
+                      [frame.name for frame in traceback.extract_tb(record.exc_info[2])])
+    
     @patch('timr_api.requests.Session.request')
     def test_connection_error_handling(self, mock_request):
         """Test connection error handling."""
@@ -245,46 +296,26 @@ class TestTimrApiErrorHandling(unittest.TestCase):
         self.assertTrue("timeout" in user_message.lower() or "timed out" in user_message.lower())
     
     @patch('timr_api.TimrApi._request')
-    def test_business_rule_detection_non_bookable_task(self, mock_request):
-        """Test detection of non-bookable task business rule."""
-        # Mock API error for non-bookable task
-        api_error = TimrApiError("Task is not bookable", 400, {"error": "Task is not bookable"})
-        mock_request.side_effect = api_error
-        
-        # Test create_project_time with non-bookable task
-        with self.assertRaises(TimrApiError) as context:
-            self.timr_api.create_project_time(
-                task_id="non_bookable_task",
-                start="2025-01-01T09:00:00Z",
-                end="2025-01-01T10:00:00Z"
-            )
-        
-        # Check that the error message is enhanced for business rule
-        enhanced_error = context.exception
-        user_message = enhanced_error.get_user_message()
-        self.assertIn("bookable", user_message.lower())
-    
-    @patch('timr_api.TimrApi._request')
-    def test_business_rule_detection_frozen_time(self, mock_request):
-        """Test detection of frozen time business rule."""
-        # Mock API error for frozen time
-        api_error = TimrApiError("Working time is frozen", 409, {"error": "Working time is frozen"})
-        mock_request.side_effect = api_error
-        
-        # Test create_project_time with frozen time
-        with self.assertRaises(TimrApiError) as context:
-            self.timr_api.create_project_time(
-                task_id="test_task",
-                start="2025-01-01T09:00:00Z",
-                end="2025-01-01T10:00:00Z"
-            )
-        
-        # Check that the error message is enhanced for business rule
-        enhanced_error = context.exception
-        user_message = enhanced_error.get_user_message()
-        self.assertIn("frozen", user_message.lower())
+    def test_business_rule_detection(self, mock_request):
+        """Test detection of business rule violations when creating project times."""
+        for message, status_code, expected_substring in BUSINESS_RULE_ERRORS:
+            with self.subTest(message=message):
+                # Mock API error for the business rule violation
+                mock_request.side_effect = TimrApiError(message, status_code, {"error": message})
+                
+                with self.assertRaises(TimrApiError) as context:
+                    self.timr_api.create_project_time(
+                        task_id="test_task",
+                        start="2025-01-01T09:00:00Z",
+                        end="2025-01-01T10:00:00Z"
+                    )
+                
+                # Check that the error message is enhanced for business rule
+                user_message = context.exception.get_user_message()
+                self.assertIn(expected_substring, user_message.lower())
 
 
+@unittest.skipUnless(APP_TESTS_ENABLED, "Flask app tests disabled (SKIP_APP_TESTS=1 or Flask not installed)")
 class TestAppErrorHandling(unittest.TestCase):
     """Test enhanced error handling in Flask app endpoints."""
     
@@ -316,7 +347,7 @@ class TestAppErrorHandling(unittest.TestCase):
         # Check response format
         self.assertEqual(response.status_code, 400)
         
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('error', response_data)
         self.assertIsInstance(response_data['error'], str)
     
@@ -330,7 +361,7 @@ class TestAppErrorHandling(unittest.TestCase):
         # Should return 400 with validation error
         self.assertEqual(response.status_code, 400)
         
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('error', response_data)
         self.assertIn('no data provided', response_data['error'].lower())
     
@@ -348,7 +379,7 @@ class TestAppErrorHandling(unittest.TestCase):
         # Should return 400 with validation error
         self.assertEqual(response.status_code, 400)
         
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('error', response_data)
         self.assertIn('positive', response_data['error'].lower())
 
@@ -356,28 +387,19 @@ class TestAppErrorHandling(unittest.TestCase):
 class TestErrorHandlerLogging(unittest.TestCase):
     """Test that error logs contain sufficient information for debugging."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a test logger with string capture
-        self.log_capture_string = StringIO()
-        self.log_handler = logging.StreamHandler(self.log_capture_string)
-        
-        # Configure the handler to capture structured log data
-        formatter = logging.Formatter('%(message)s')
-        self.log_handler.setFormatter(formatter)
-        
-        self.test_logger = logging.getLogger('test_structured_logging')
-        self.test_logger.addHandler(self.log_handler)
-        self.test_logger.setLevel(logging.DEBUG)
-        
-        # Create error handler with test logger
-        self.error_handler = EnhancedErrorHandler('test_structured_logging')
-        self.error_handler.logger = self.test_logger
+    @classmethod
+    def setUpClass(cls):
+        """Create the error handler once; tests never mutate its state."""
+        cls.test_logger = logging.getLogger('test_structured_logging')
+        cls.test_logger.setLevel(logging.DEBUG)
+        
+        cls.error_handler = EnhancedErrorHandler('test_structured_logging')
+        cls.error_handler.logger = cls.test_logger
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.test_logger.removeHandler(self.log_handler)
-        self.log_handler.close()
+    def _assert_record_fields(self, record, expected_fields):
+        """Assert structured fields attached to a log record via ``extra``."""
+        actual_fields = {name: getattr(record, name, None) for name in expected_fields}
+        self.assertEqual(actual_fields, expected_fields)
     
     def test_structured_logging_contains_required_fields(self):
         """Test that error logs contain all required fields for debugging."""
@@ -396,35 +418,29 @@ class TestErrorHandlerLogging(unittest.TestCase):
         )
         
         error = Exception("Test error for logging")
-        user_message = self.error_handler.log_error(error, context)
-        
-        # Check that log contains structured information
-        log_contents = self.log_capture_string.getvalue()
-        
-        # Verify key information is present
-        self.assertIn("TIMR_API_ERROR", log_contents)
-        self.assertIn("test_operation", log_contents)
-        self.assertIn("user_123", log_contents)
-        self.assertIn("wt_456", log_contents)
-        self.assertIn("task_789", log_contents)
-        self.assertIn("/test-endpoint", log_contents)
-        self.assertIn("500", log_contents)
-        
-        # Verify sensitive data is not exposed in the main log message
-        self.assertNotIn("secret", log_contents)
-        # Note: Sensitive data sanitization happens in the 'extra' data passed to logger,
-        # which is not included in the basic message format we're testing here.
-        # The sanitization is working but not visible in this simple log format.
+        with self.assertLogs(self.test_logger, level=logging.DEBUG) as captured:
+            user_message = self.error_handler.log_error(error, context)
+        
+        record = captured.records[-1]
+        
+        # Verify key information is present in the structured record
+        self._assert_record_fields(record, {
+            "error_category": "timr_api_error",
+            "operation": "test_operation",
+            "user_id": "user_123",
+            "working_time_id": "wt_456",
+            "task_id": "task_789",
+            "api_endpoint": "/test-endpoint",
+            "api_status_code": 500,
+        })
+        
+        # Verify sensitive data is sanitized in the structured data and not exposed in the message
+        self.assertEqual(record.request_data, {"test": "data", "password": "***REDACTED***"})
+        self.assertNotIn("secret", record.getMessage())
         
         # Verify user message is returned
         self.assertIsInstance(user_message, str)
         self.assertGreater(len(user_message), 0)
-        
-        # Separately test the sanitization functionality
-        sanitized_data = self.error_handler._sanitize_request_data({"test": "data", "password": "secret"})
-        self.assertEqual(sanitized_data["password"], "***REDACTED***")
-        self.assertEqual(sanitized_data["test"], "data")
-
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
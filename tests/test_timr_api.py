@@ -1,67 +1,254 @@
 import unittest
 import datetime
-import pytz
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+from config import API_TIMEOUT
 from timr_api import TimrApi, TimrApiError
 
+UTC = datetime.timezone.utc
+
+SAMPLE_DATETIME = datetime.datetime(2025, 5, 1, 9, 0, 0, tzinfo=UTC)
+SAMPLE_NAIVE_DATETIME = datetime.datetime(2025, 5, 1, 9, 0, 0)
+SAMPLE_DATE = datetime.date(2025, 5, 1)
+SAMPLE_ISO_Z = "2025-05-01T09:00:00Z"
+SAMPLE_ISO_TZ = "2025-05-01T09:00:00+00:00"
+SAMPLE_DATE_STR = "2025-05-01"
+
+# (input, expected API representation)
+FORMAT_DATETIME_ISO8601_CASES = [
+    (SAMPLE_DATETIME, "2025-05-01T09:00:00+00:00"),
+    (SAMPLE_ISO_Z, "2025-05-01T09:00:00+00:00"),
+    (SAMPLE_ISO_TZ, "2025-05-01T09:00:00+00:00"),
+    (SAMPLE_DATE_STR, "2025-05-01T00:00:00+00:00"),
+    (SAMPLE_DATE, "2025-05-01T00:00:00+00:00"),
+]
+
+FORMAT_DATE_FOR_QUERY_CASES = [
+    (SAMPLE_NAIVE_DATETIME, "2025-05-01"),
+    (SAMPLE_DATE, "2025-05-01"),
+    (SAMPLE_ISO_Z, "2025-05-01"),
+    (SAMPLE_DATE_STR, "2025-05-01"),
+]
+
 
 class TestTimrApi(unittest.TestCase):
     """Tests for the TimrApi class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.api = TimrApi(company_id="test_company")
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures; the formatting helpers don't mutate the client"""
+        cls.api = TimrApi(company_id="test_company")
         # Mock token for testing
-        self.api.token = "test_token"
-        self.api.user = {"id": "test_user"}
+        cls.api.token = "test_token"
+        cls.api.user = {"id": "test_user"}
 
     def test_format_datetime_iso8601(self):
         """Test date formatting for API communication"""
-        # Test with a datetime object
-        dt = datetime.datetime(2025, 5, 1, 9, 0, 0, tzinfo=pytz.UTC)
-        formatted = self.api._format_datetime_iso8601(dt)
-        self.assertEqual(formatted, "2025-05-01T09:00:00+00:00")
-
-        # Test with a string already in ISO format with Z
-        dt_str = "2025-05-01T09:00:00Z"
-        formatted = self.api._format_datetime_iso8601(dt_str)
-        self.assertEqual(formatted, "2025-05-01T09:00:00+00:00")
-
-        # Test with a string already in ISO format with timezone
-        dt_str = "2025-05-01T09:00:00+00:00"
-        formatted = self.api._format_datetime_iso8601(dt_str)
-        self.assertEqual(formatted, "2025-05-01T09:00:00+00:00")
-
-        # Test with a date-only string
-        dt_str = "2025-05-01"
-        formatted = self.api._format_datetime_iso8601(dt_str)
-        self.assertEqual(formatted, "2025-05-01T00:00:00+00:00")
-
-        # Test with a date object
-        dt = datetime.date(2025, 5, 1)
-        formatted = self.api._format_datetime_iso8601(dt)
-        self.assertEqual(formatted, "2025-05-01T00:00:00+00:00")
+        for value, expected in FORMAT_DATETIME_ISO8601_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(self.api._format_datetime_iso8601(value), expected)
 
     def test_format_date_for_query(self):
         """Test date formatting for query parameters"""
-        # Test with a datetime object
-        dt = datetime.datetime(2025, 5, 1, 9, 0, 0)
-        formatted = self.api._format_date_for_query(dt)
-        self.assertEqual(formatted, "2025-05-01")
+        for value, expected in FORMAT_DATE_FOR_QUERY_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(self.api._format_date_for_query(value), expected)
+
+    def test_session_is_shared_when_passed(self):
+        """Test that an injected session is reused instead of creating a new one"""
+        shared = TimrApi(company_id="other_company", session=self.api.session)
+        self.assertIs(shared.session, self.api.session)
+        self.assertIsNot(TimrApi(company_id="test_company").session, self.api.session)
+
+
+def _response(status_code, body=None):
+    """Build a canned ``requests.Response`` with an optional JSON body"""
+    response = requests.Response()
+    response.status_code = status_code
+    if body is not None:
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+    return response
+
+
+class TestTimrApiRequests(unittest.TestCase):
+    """Tests for request serialization and response parsing, without network access"""
+
+    def setUp(self):
+        """Create a logged in client whose session never reaches the network"""
+        self.api = TimrApi(company_id="test_company")
+        self.api.token = "test_token"
+        self.api.user = {"id": "test_user"}
+        patcher = patch.object(self.api.session, "request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _sent(self):
+        """Return method, URL and decoded JSON payload of the last request"""
+        kwargs = self.mock_request.call_args.kwargs
+        data = json.loads(kwargs["data"]) if kwargs["data"] else None
+        return kwargs["method"], kwargs["url"], data
+
+    def test_create_working_time(self):
+        """Test the working time payload and the parsed response"""
+        self.mock_request.return_value = _response(200, {"id": "wt1", "break_time_total_minutes": 30})
+
+        wt = self.api.create_working_time(start=SAMPLE_ISO_Z, end="2025-05-01T17:00:00Z",
+                                          pause_duration=30)
+
+        method, url, data = self._sent()
+        self.assertEqual((method, url), ("POST", f"{self.api.base_url}/working-times"))
+        self.assertEqual(data["start"], "2025-05-01T09:00:00+00:00")
+        self.assertEqual(data["end"], "2025-05-01T17:00:00+00:00")
+        self.assertEqual(data["break_times"], [{"type": "manual", "start": "2025-05-01T09:00:00+00:00",
+                                                "duration_minutes": 30}])
+        self.assertEqual(data["user_id"], "test_user")
+        self.assertEqual(self.mock_request.call_args.kwargs["headers"]["Authorization"], "Bearer test_token")
+        self.assertEqual(self.mock_request.call_args.kwargs["timeout"], API_TIMEOUT)
+        self.assertEqual(wt, {"id": "wt1", "break_time_total_minutes": 30})
+
+    def test_update_working_time_pause(self):
+        """Test that a pause update sends only type and duration"""
+        self.mock_request.return_value = _response(200, {"id": "wt1"})
+
+        self.api.update_working_time("wt1", end="2025-05-01T18:00:00Z", pause_duration=45)
+
+        method, url, data = self._sent()
+        self.assertEqual((method, url), ("PATCH", f"{self.api.base_url}/working-times/wt1"))
+        self.assertEqual(data["end"], "2025-05-01T18:00:00+00:00")
+        self.assertEqual(data["break_times"], [{"type": "manual", "duration_minutes": 45}])
+
+    def test_update_project_time_end(self):
+        """Test that a project time update sends the normalized end time"""
+        self.mock_request.return_value = _response(200, {"id": "pt1"})
+
+        self.api.update_project_time("pt1", end=SAMPLE_DATETIME)
 
-        # Test with a date object
-        dt = datetime.date(2025, 5, 1)
-        formatted = self.api._format_date_for_query(dt)
-        self.assertEqual(formatted, "2025-05-01")
+        method, url, data = self._sent()
+        self.assertEqual((method, url), ("PATCH", f"{self.api.base_url}/project-times/pt1"))
+        self.assertEqual(data, {"changed": True, "end": "2025-05-01T09:00:00+00:00"})
 
-        # Test with an ISO string
-        dt_str = "2025-05-01T09:00:00Z"
-        formatted = self.api._format_date_for_query(dt_str)
-        self.assertEqual(formatted, "2025-05-01")
+    def test_delete_returns_empty_dict_on_no_content(self):
+        """Test that deletes map a 204 response to an empty dict"""
+        for delete, endpoint in ((self.api.delete_working_time, "working-times"),
+                                 (self.api.delete_project_time, "project-times")):
+            with self.subTest(endpoint=endpoint):
+                self.mock_request.return_value = _response(204)
+                self.assertEqual(delete("id1"), {})
+                self.assertEqual(self._sent()[:2], ("DELETE", f"{self.api.base_url}/{endpoint}/id1"))
 
-        # Test with a date-only string
-        dt_str = "2025-05-01"
-        formatted = self.api._format_date_for_query(dt_str)
-        self.assertEqual(formatted, "2025-05-01")
+    def test_not_found_raises_api_error(self):
+        """Test that a 404 for a deleted entry raises TimrApiError with its status"""
+        self.mock_request.return_value = _response(404, {"message": "Not found"})
+
+        with self.assertRaises(TimrApiError) as raised:
+            self.api.get_project_time("pt1")
+
+        self.assertEqual(raised.exception.status_code, 404)
+
+
+class _EmptyPageHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that answers every GET with an empty page and counts connections"""
+
+    protocol_version = "HTTP/1.1"
+    connections = []
+
+    def setup(self):
+        super().setup()
+        self.connections.append(self.client_address)
+
+    def do_GET(self):
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTimrApiConnectionReuse(unittest.TestCase):
+    """Tests that consecutive requests share one keep-alive connection, against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Serve canned empty pages on an ephemeral localhost port"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _EmptyPageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _EmptyPageHandler.connections.clear()
+        self.api = TimrApi(company_id="test_company")
+        self.api.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.api.token = "test_token"
+        self.api.user = {"id": "test_user"}
+        # Route the local server through the client's configured https adapter
+        self.api.session.mount("http://", self.api.session.get_adapter("https://"))
+        # Keep proxy settings from the environment away from the local server
+        self.api.session.trust_env = False
+        self.addCleanup(self.api.session.close)
+
+    def test_requests_reuse_one_connection(self):
+        """Test that several API calls on one client open a single connection"""
+        for _ in range(5):
+            self.assertEqual(self.api.get_working_times(start_date=SAMPLE_DATE, end_date=SAMPLE_DATE), [])
+
+        self.assertEqual(len(_EmptyPageHandler.connections), 1)
+
+
+class TestTimrApiReadTimeout(unittest.TestCase):
+    """Tests that a hung response is not retried, against a local server that never answers"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Accept connections on an ephemeral localhost port without ever responding"""
+        cls.listener = socket.create_server(("127.0.0.1", 0))
+        cls.connections = []
+        threading.Thread(target=cls._accept, daemon=True).start()
+
+    @classmethod
+    def _accept(cls):
+        while True:
+            try:
+                connection, _ = cls.listener.accept()
+            except OSError:
+                return
+            cls.connections.append(connection)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.listener.close()
+        for connection in cls.connections:
+            connection.close()
+
+    def test_read_timeout_raises_after_one_attempt(self):
+        """Test that the default session sends a timed out GET once and reports it as a timeout"""
+        api = TimrApi(company_id="test_company", timeout=(1, 0.2))
+        api.base_url = f"http://127.0.0.1:{self.listener.getsockname()[1]}"
+        api.token = "test_token"
+        # Route the local server through the client's configured https adapter
+        api.session.mount("http://", api.session.get_adapter("https://"))
+        api.session.trust_env = False
+        self.addCleanup(api.session.close)
+
+        with self.assertRaises(TimrApiError) as raised:
+            api.get_project_time("pt1")
+
+        self.assertIsInstance(raised.exception.__cause__, requests.exceptions.ReadTimeout)
+        self.assertEqual(len(self.connections), 1)
 
 
 class TestTimrApiError(unittest.TestCase):
@@ -80,7 +267,3 @@ class TestTimrApiError(unittest.TestCase):
         
         self.assertEqual(str(error), "Test error")
         self.assertIsNone(error.status_code)
-
-
-if __name__ == '__main__':
-    unittest.main()
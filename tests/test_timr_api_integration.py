@@ -1,20 +1,39 @@
 import unittest
 import os
 import datetime
+import functools
+import json
 import logging
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest.mock import patch
+import requests
 from timr_api import TimrApi, TimrApiError
-from config import COMPANY_ID
+from config import API_BASE_URL, COMPANY_ID
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Confirm deletions with an extra GET (set FULL_VERIFY=1, e.g. in CI)
+FULL_VERIFY = os.environ.get("FULL_VERIFY") == "1"
 
-class TimrAPIIntegrationTest(unittest.TestCase):
+# Seconds to wait for the reachability probe before skipping the integration tests
+PROBE_TIMEOUT = 2
+
+# Optional path of a file that keeps the login token between runs (opt-in)
+TOKEN_CACHE_PATH = os.path.expanduser(os.environ.get("TIMR_TEST_TOKEN_CACHE", "")) or None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_iso(value):
+    """Parse an ISO 8601 timestamp as returned by the Timr API, accepting a Z suffix."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+class TimrAPIIntegrationTestBase(unittest.TestCase):
     """
-    Integration tests for the Timr API client against the real Timr API.
+    Shared setup for the integration tests of the Timr API client against the real Timr API.
 
     IMPORTANT: These tests will use the real Timr.com API service, not mocks.
 
@@ -28,6 +47,10 @@ class TimrAPIIntegrationTest(unittest.TestCase):
     3. Validate the responses and behavior 
     4. Clean up any test data created
 
+    The tests are split into a read-only and a mutating class. Each class logs in
+    and tracks its own test data, so pytest-xdist can run them on separate workers
+    (``--dist loadscope``).
+
     WARNING: These tests WILL make changes to your Timr.com account!
     """
 
@@ -44,25 +67,58 @@ class TimrAPIIntegrationTest(unittest.TestCase):
                 "Skipping integration tests: Set TIMR_USER and TIMR_PASSWORD environment variables to run"
             )
 
-        # Initialize API client
+        # Skip fast if the API can't be reached at all; any HTTP response will do
+        try:
+            requests.head(API_BASE_URL, timeout=PROBE_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise unittest.SkipTest(f"Skipping integration tests: Timr API unreachable ({e})")
+
+        # Initialize API client; all requests of the class share its pooled keep-alive session
         cls.api = TimrApi(company_id=COMPANY_ID)
 
-        # Test date (yesterday to avoid API restrictions)
+        # Test date (yesterday to avoid API restrictions); test_timr_api_integration_enhanced.py
+        # uses the day before, so the two suites don't book into the same slot
         yesterday = datetime.date.today() - datetime.timedelta(days=1)
         cls.test_date = yesterday
         cls.test_date_str = yesterday.strftime("%Y-%m-%d")
+        # Canonical timestamps on the test date used by the tests
+        cls.TS = SimpleNamespace(
+            t0900=f"{cls.test_date_str}T09:00:00+00:00",
+            t1000=f"{cls.test_date_str}T10:00:00+00:00",
+            t1200=f"{cls.test_date_str}T12:00:00+00:00",
+            t1400=f"{cls.test_date_str}T14:00:00+00:00",
+            t1600=f"{cls.test_date_str}T16:00:00+00:00",
+            t1700=f"{cls.test_date_str}T17:00:00+00:00",
+            t1800=f"{cls.test_date_str}T18:00:00+00:00",
+        )
+        # Bounds of the shared working time (TS.t0900 to TS.t1700) as datetimes
+        cls.WT_START_DT = datetime.datetime.combine(yesterday, datetime.time(9, 0), tzinfo=datetime.timezone.utc)
+        cls.WT_END_DT = datetime.datetime.combine(yesterday, datetime.time(17, 0), tzinfo=datetime.timezone.utc)
 
-        # Login to Timr API
+        # Login to Timr API, reusing a cached token if one is configured and still valid
         try:
-            cls.login_response = cls.api.login(cls.username, cls.password)
-            logger.info("Successfully logged in to Timr API")
-            cls.user_id = cls.api.user.get("id")
+            used_cached_token = cls._login()
         except TimrApiError as e:
             raise unittest.SkipTest(f"Could not login to Timr API: {e}")
 
-        # Test data tracking for cleanup - use sets to avoid duplicates
-        cls.created_working_times = set()
-        cls.created_project_times = set()
+        # Fetch the task list once; tests only read it
+        try:
+            cls._all_tasks = cls.api.get_tasks()
+        except TimrApiError as e:
+            if not used_cached_token or e.status_code != 401:
+                raise
+            # The cached token was revoked server-side: log in again once
+            logger.info("Cached Timr API token was rejected, logging in again")
+            cls._login(use_cache=False)
+            cls._all_tasks = cls.api.get_tasks()
+
+        # Class-scoped test data tracking for cleanup, keyed by ID. Entries created
+        # by a single test are deleted through addCleanup instead.
+        cls.created_working_times = {}
+        cls.created_project_times = {}
+
+        # Worker pool shared by all cleanup deletes of the class
+        cls._cleanup_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="timr-cleanup")
 
     @classmethod
     def tearDownClass(cls):
@@ -73,67 +129,121 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         cleanup_summary = {"working_times": 0, "project_times": 0, "errors": 0}
 
         # Delete all test project times first (before working times to avoid FK constraints)
-        for pt_id in cls.created_project_times.copy():
-            try:
-                cls.api.delete_project_time(pt_id)
-                logger.info(f"Deleted test project time {pt_id}")
-                cls.created_project_times.discard(pt_id)
-                cleanup_summary["project_times"] += 1
-            except TimrApiError as e:
-                logger.warning(f"Could not delete test project time {pt_id}: {e}")
-                cleanup_summary["errors"] += 1
+        cls._delete_tracked(cls.created_project_times, cls.api.delete_project_time,
+                            "project time", "project_times", cleanup_summary)
 
         # Delete all test working times
-        for wt_id in cls.created_working_times.copy():
+        cls._delete_tracked(cls.created_working_times, cls.api.delete_working_time,
+                            "working time", "working_times", cleanup_summary)
+
+        logger.info("Cleanup complete: %d working times, %d project times deleted. "
+                    "%d errors encountered.",
+                    cleanup_summary['working_times'], cleanup_summary['project_times'],
+                    cleanup_summary['errors'])
+
+        cls._cleanup_pool.shutdown(wait=True)
+        cls.api.session.close()
+
+    @classmethod
+    def _login(cls, use_cache=True):
+        """Log in and set cls.login_response/cls.user_id; returns True if a cached token was used."""
+        cached = cls._load_cached_login() if use_cache else None
+        if cached:
+            cls.api.token = cached["token"]
+            cls.api.user = cached["user"]
+            cls.login_response = cached["response"]
+            logger.info("Reusing cached Timr API token")
+        else:
+            cls.login_response = cls.api.login(cls.username, cls.password)
+            logger.info("Successfully logged in to Timr API")
+            cls._store_cached_login()
+        cls.user_id = cls.api.user.get("id")
+        return bool(cached)
+
+    @classmethod
+    def _load_cached_login(cls):
+        """Return the cached login for the current user if it is valid for at least another minute."""
+        if not TOKEN_CACHE_PATH:
+            return None
+        try:
+            with open(TOKEN_CACHE_PATH, encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            expires_at = datetime.datetime.fromisoformat(cached["expires_at"])
+        except (OSError, ValueError, KeyError):
+            return None
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+        if cached.get("login") != [COMPANY_ID, cls.username]:
+            return None
+        if expires_at <= datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60):
+            return None
+        return cached
+
+    @classmethod
+    def _store_cached_login(cls):
+        """Write the current token to the cache file, readable only by the current user."""
+        if not TOKEN_CACHE_PATH or cls.api.token_expiry is None:
+            return
+        cached = {
+            "login": [COMPANY_ID, cls.username],
+            "token": cls.api.token,
+            "user": cls.api.user,
+            "expires_at": cls.api.token_expiry.isoformat(),
+            "response": cls.login_response,
+        }
+        tmp_path = f"{TOKEN_CACHE_PATH}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(tmp_path, TOKEN_CACHE_PATH)
+        except OSError as e:
+            logger.warning("Could not write token cache %s: %s", TOKEN_CACHE_PATH, e)
+
+    @classmethod
+    def _delete_tracked(cls, tracked, delete_func, label, summary_key, cleanup_summary):
+        """Delete tracked entries concurrently; returns once all deletes have finished."""
+        # Drain the tracking dict while submitting; failed entries are put back
+        futures = {}
+        while tracked:
+            entry_id, entry = tracked.popitem()
+            futures[cls._cleanup_pool.submit(delete_func, entry_id)] = (entry_id, entry)
+        # Results are collected on this thread, so the summary needs no lock
+        for future in as_completed(futures):
+            entry_id, entry = futures[future]
             try:
-                cls.api.delete_working_time(wt_id)
-                logger.info(f"Deleted test working time {wt_id}")
-                cls.created_working_times.discard(wt_id)
-                cleanup_summary["working_times"] += 1
+                future.result()
+                logger.debug("Deleted test %s %s", label, entry_id)
+                cleanup_summary[summary_key] += 1
             except TimrApiError as e:
-                logger.warning(f"Could not delete test working time {wt_id}: {e}")
+                logger.warning("Could not delete test %s %s: %s", label, entry_id, e)
+                tracked[entry_id] = entry
                 cleanup_summary["errors"] += 1
 
-        logger.info(f"Cleanup complete: {cleanup_summary['working_times']} working times, "
-                   f"{cleanup_summary['project_times']} project times deleted. "
-                   f"{cleanup_summary['errors']} errors encountered.")
+    def _assert_iso_equal(self, actual, expected):
+        """Assert that two ISO 8601 timestamps denote the same instant, whatever their offset notation."""
+        self.assertEqual(_parse_iso(actual), _parse_iso(expected))
+
+    def _delete_quietly(self, delete_func, label, entry_id):
+        """Delete an entry at test cleanup; entries the test already deleted are skipped."""
+        try:
+            delete_func(entry_id)
+            logger.debug("Deleted test %s %s", label, entry_id)
+        except TimrApiError as e:
+            if e.status_code != 404:
+                logger.warning("Could not delete test %s %s: %s", label, entry_id, e)
 
     def _track_working_time(self, working_time_id):
-        """Track a working time for cleanup."""
-        self.created_working_times.add(working_time_id)
-        logger.debug(f"Tracking working time for cleanup: {working_time_id}")
+        """Delete a working time created by this test once the test has finished."""
+        self.addCleanup(self._delete_quietly, self.api.delete_working_time, "working time", working_time_id)
 
     def _track_project_time(self, project_time_id):
-        """Track a project time for cleanup."""
-        self.created_project_times.add(project_time_id)
-        logger.debug(f"Tracking project time for cleanup: {project_time_id}")
-
-    def _get_or_create_working_time(self):
-        """Get an existing test working time or create a new one."""
-        if self.created_working_times:
-            # Use existing working time
-            wt_id = next(iter(self.created_working_times))
-            return self.api.get_working_time(wt_id)
-        else:
-            # Create new working time
-            start = f"{self.test_date_str}T09:00:00+00:00"
-            end = f"{self.test_date_str}T17:00:00+00:00"
-            pause_duration = 30
-            
-            wt = self.api.create_working_time(start=start, end=end, pause_duration=pause_duration)
-            self._track_working_time(wt["id"])
-            return wt
-
-    def _get_bookable_task(self):
-        """Get a bookable task for testing."""
-        tasks = self.api.get_tasks()[:10]
-        self.assertGreaterEqual(len(tasks), 1)
-        
-        # Find a bookable task or use the first one
-        for task in tasks:
-            if task.get("bookable", False):
-                return task
-        return tasks[0]
+        """Delete a project time created by this test once the test has finished."""
+        self.addCleanup(self._delete_quietly, self.api.delete_project_time, "project time", project_time_id)
+
+
+class TimrAPIReadOnlyIntegrationTest(TimrAPIIntegrationTestBase):
+    """Integration tests that only read data from the Timr API."""
 
     def test_01_login_success(self):
         """Test that login works correctly with valid credentials."""
@@ -141,117 +251,40 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         self.assertIsNotNone(self.login_response)
         self.assertIn("token", self.login_response)
         self.assertIsNotNone(self.user_id)
-        logger.info(f"Login successful, user ID: {self.user_id}")
+        logger.info("Login successful, user ID: %s", self.user_id)
 
     def test_02_login_failure(self):
-        """Test that login fails with invalid credentials."""
-        # Create a new API instance for testing bad credentials
-        bad_api = TimrApi(company_id=COMPANY_ID)
-
-        # Try login with invalid credentials
-        with self.assertRaises(TimrApiError):
-            bad_api.login("wrong_username", "wrong_password")
-
-    def test_03_create_working_time(self):
-        """Test creating a working time."""
-        # Create test data
-        start = f"{self.test_date_str}T09:00:00+00:00"
-        end = f"{self.test_date_str}T17:00:00+00:00"
-        pause_duration = 30
-
-        # Create working time
-        wt = self.api.create_working_time(start=start, end=end, pause_duration=pause_duration)
-
-        # Track for cleanup
-        self._track_working_time(wt["id"])
-
-        # Verify working time was created correctly
-        self.assertIn("id", wt)
-        self.assertIn("start", wt)
-        self.assertIn("end", wt)
-        self.assertEqual(wt["break_time_total_minutes"], pause_duration)
-
-        logger.info(f"Created working time: {wt['id']}")
-
-    def test_04_get_working_times(self):
-        """Test getting working times for a date."""
-        # Ensure we have a working time
-        self._get_or_create_working_time()
-
-        # Get working times for the test date
-        working_times = self.api.get_working_times(start_date=self.test_date,
-                                                  end_date=self.test_date,
-                                                  user_id=self.user_id)
-
-        # Verify we got at least one working time
-        self.assertGreaterEqual(len(working_times), 1)
-
-        # Verify at least one of our test working times is in the results
-        wt_ids = [wt.get("id") for wt in working_times]
-        test_wt_found = any(wt_id in wt_ids for wt_id in self.created_working_times)
-        self.assertTrue(test_wt_found, "At least one test working time should be found")
-
-    def test_05_update_working_time(self):
-        """Test updating a working time."""
-        # Create a working time for testing
-        start = f"{self.test_date_str}T09:00:00+00:00"
-        end = f"{self.test_date_str}T17:00:00+00:00"
-        pause_duration = 30
-
-        wt = self.api.create_working_time(start=start, end=end, pause_duration=pause_duration)
-        self._track_working_time(wt["id"])
+        """Test that login fails with invalid credentials.
 
-        # Prepare update data
-        new_end = f"{self.test_date_str}T18:00:00+00:00"
-        new_pause = 45
-
-        logger.info(f"TEST_05: Original working time: {wt}")
-        logger.info(f"TEST_05: Updating with new_end={new_end}, new_pause={new_pause}")
-
-        # Update working time
-        updated_wt = self.api.update_working_time(working_time_id=wt["id"],
-                                                 end=new_end,
-                                                 pause_duration=new_pause)
-
-        logger.info(f"TEST_05: Updated working time: {updated_wt}")
-
-        # Verify working time was updated correctly
-        self.assertEqual(updated_wt["id"], wt["id"])
-        self.assertEqual(updated_wt["break_time_total_minutes"], new_pause)
-
-    def test_06_create_project_time(self):
-        """Test creating a project time."""
-        # Get or create a working time for testing
-        wt = self._get_or_create_working_time()
-
-        # Get a task for testing
-        task = self._get_bookable_task()
-
-        # Create project time data
-        start = wt["start"]
-        end_dt = datetime.datetime.fromisoformat(start.replace('Z', '+00:00')) + datetime.timedelta(hours=1)
-        end = end_dt.isoformat()
-
-        # Create project time
-        pt = self.api.create_project_time(task_id=task["id"],
-                                         start=start,
-                                         end=end)
+        The rejection is stubbed at the transport level; the successful login in
+        setUpClass already covers the real /login endpoint.
+        """
+        rejected = requests.Response()
+        rejected.status_code = 401
+        rejected.headers["Content-Type"] = "application/json"
+        rejected._content = b'{"error": "invalid_credentials"}'
 
-        # Track for cleanup
-        self._track_project_time(pt["id"])
+        # Reuse the class client; clear its token so the attempt is unauthenticated
+        saved_token = self.api.token
+        try:
+            self.api.token = None
+            # Try login with invalid credentials
+            with patch.object(self.api.session, "request", return_value=rejected) as mock_request, \
+                    self.assertRaises(TimrApiError) as raised:
+                self.api.login("wrong_username", "wrong_password")
 
-        # Verify project time was created correctly
-        self.assertIn("id", pt)
-        self.assertIn("start", pt)
-        self.assertIn("end", pt)
-        self.assertEqual(pt["task"]["id"], task["id"])
+            self.assertIsNone(self.api.token)
+        finally:
+            self.api.token = saved_token
 
-        logger.info(f"Created project time: {pt['id']}")
+        self.assertEqual(raised.exception.status_code, 401)
+        self.assertEqual(mock_request.call_args.kwargs["url"], f"{self.api.base_url}/login")
+        self.assertNotIn("Authorization", mock_request.call_args.kwargs["headers"])
 
     def test_07_get_tasks(self):
         """Test getting tasks."""
-        # Get tasks (limit to first 10)
-        tasks = self.api.get_tasks()[:10]
+        # Check the first 10 tasks fetched in setUpClass
+        tasks = self._all_tasks[:10]
 
         # Verify we got at least one task
         self.assertGreaterEqual(len(tasks), 1)
@@ -263,8 +296,8 @@ class TimrAPIIntegrationTest(unittest.TestCase):
 
     def test_08_search_tasks(self):
         """Test searching for tasks."""
-        # Get tasks to find one to search for
-        tasks = self.api.get_tasks()[:10]
+        # Pick a task to search for from the cached task list
+        tasks = self._all_tasks[:10]
         self.assertGreaterEqual(len(tasks), 1)
 
         task = tasks[0]  # Use first task for search test
@@ -282,111 +315,243 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         task_ids = [t.get("id") for t in search_results]
         self.assertIn(task["id"], task_ids)
 
-    def test_09_get_project_times(self):
-        """Test getting project times."""
-        # Create a project time for testing if we don't have one
-        if not self.created_project_times:
-            self.test_06_create_project_time()
+    def test_15_pagination_functionality(self):
+        """Test centralized pagination implementation with cursor pagination.
+        
+        This test validates that the _request_paginated method correctly handles
+        Timr's cursor pagination and retrieves unique data on each page.
+        """
+        # Test pagination with tasks (usually has many results), fetched in setUpClass
+        all_tasks = self._all_tasks
+        
+        # Verify we got some tasks
+        self.assertGreater(len(all_tasks), 0, "Should retrieve at least one task")
+        
+        # Test that pagination is working by checking if we have unique IDs
+        task_ids = [task["id"] for task in all_tasks]
+        unique_task_ids = set(task_ids)
+        
+        self.assertEqual(
+            len(task_ids), 
+            len(unique_task_ids), 
+            "Pagination should not return duplicate task IDs"
+        )
+        
+        logger.info("Pagination test: Retrieved %d unique tasks", len(all_tasks))
 
-        # Get project times for the test date
-        project_times = self.api.get_project_times(start_date=self.test_date,
-                                                   end_date=self.test_date,
-                                                   user_id=self.user_id)
+    def test_16_pagination_data_integrity(self):
+        """Test that pagination maintains data integrity and returns different pages."""
+        # Test pagination manually to verify different pages contain different data
+        # Make direct paginated requests to verify page differences
+        endpoint = "project-times"
+        params = {
+            "user_id": self.user_id,
+            "start_date": (self.test_date - datetime.timedelta(days=30)).strftime('%Y-%m-%d'),
+            "end_date": self.test_date.strftime('%Y-%m-%d')
+        }
+        
+        # Get first page
+        page1_params = {**params, 'limit': 50}
+        page1_response = self.api._request("GET", endpoint, params=page1_params)
+        page1_data = page1_response.get('data', [])
+        
+        if len(page1_data) >= 50:  # Only test if we have enough data for pagination
+            # Get second page using page_token
+            page_token = page1_response.get('page_token')
+            if page_token:
+                page2_params = {**page1_params, 'page_token': page_token}
+                page2_response = self.api._request("GET", endpoint, params=page2_params)
+                page2_data = page2_response.get('data', [])
+                
+                # Verify pages contain different data
+                page1_ids = {item['id'] for item in page1_data}
+                page2_ids = {item['id'] for item in page2_data}
+                
+                self.assertGreater(len(page1_ids), 0, "First page should contain data")
+                self.assertGreater(len(page2_ids), 0, "Second page should contain data")
+                
+                # Critical test: pages should not contain duplicate items
+                overlap = page1_ids.intersection(page2_ids)
+                self.assertEqual(len(overlap), 0, 
+                    f"Pages should not contain duplicate items, but found {len(overlap)} overlapping IDs")
+                
+                logger.info("Pagination integrity verified: Page 1 has %d items, "
+                            "Page 2 has %d items, no overlap", len(page1_ids), len(page2_ids))
+            else:
+                logger.info("No page_token returned - only one page of data available")
+        else:
+            logger.info("Insufficient data for pagination test (%d items)", len(page1_data))
+        
+        # Verify data structure integrity for any returned data
+        all_data = page1_data
+        for item in all_data:
+            self.assertIn("id", item, "Project time should have an ID")
+            self.assertIn("start", item, "Project time should have a start time")
+            self.assertIn("end", item, "Project time should have an end time")
+        
+        logger.info("Data integrity test: %d project times validated", len(all_data))
 
-        # Verify we got at least one project time
-        self.assertGreaterEqual(len(project_times), 1)
 
-        # Verify at least one of our test project times is in the results
-        pt_ids = [pt.get("id") for pt in project_times]
-        test_pt_found = any(pt_id in pt_ids for pt_id in self.created_project_times)
-        self.assertTrue(test_pt_found, "At least one test project time should be found")
+class TimrAPIMutationIntegrationTest(TimrAPIIntegrationTestBase):
+    """Integration tests that create, update and delete data through the Timr API.
 
-    def test_10_update_project_time(self):
-        """Test updating a project time."""
-        # Create a project time for testing if we don't have one
-        if not self.created_project_times:
-            self.test_06_create_project_time()
+    A working time, a bookable task and a project time are set up once for the
+    class. Tests only read these shared fixtures; tests that mutate or delete an
+    entry create their own and register its deletion with ``addCleanup``, so
+    tests don't depend on each other and may run in any order.
+    """
 
-        pt_id = next(iter(self.created_project_times))
-        pt = self.api.get_project_time(pt_id)
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared fixtures after logging in."""
+        super().setUpClass()
+        try:
+            # Use the first bookable task among the first 10, or the first task
+            tasks = cls._all_tasks[:10]
+            cls.shared_task = next((task for task in tasks if task.get("bookable", False)), tasks[0])
+
+            cls.shared_wt = cls.api.create_working_time(start=cls.TS.t0900, end=cls.TS.t1700,
+                                                        pause_duration=30)
+            cls.created_working_times[cls.shared_wt["id"]] = cls.shared_wt
+
+            end = (cls.WT_START_DT + datetime.timedelta(hours=1)).isoformat()
+            cls.shared_pt = cls.api.create_project_time(task_id=cls.shared_task["id"],
+                                                        start=cls.shared_wt["start"], end=end)
+            cls.created_project_times[cls.shared_pt["id"]] = cls.shared_pt
+        except Exception:
+            # tearDownClass isn't called when setUpClass fails, so clean up here
+            cls.tearDownClass()
+            raise
+
+    def _create_project_time_for(self, offset_minutes=0, duration_minutes=60):
+        """Create and clean up a project time relative to the start of the shared working time.
+
+        Returns:
+            tuple: (project time, working time, task)
+        """
+        wt = self.shared_wt
+        task = self.shared_task
 
-        # Prepare update data - extend by 30 minutes
-        end_dt = datetime.datetime.fromisoformat(pt["end"].replace('Z', '+00:00'))
-        new_end_dt = end_dt + datetime.timedelta(minutes=30)
-        new_end = new_end_dt.isoformat()
+        start_dt = self.WT_START_DT + datetime.timedelta(minutes=offset_minutes)
+        end_dt = start_dt + datetime.timedelta(minutes=duration_minutes)
 
-        # Update project time
-        updated_pt = self.api.update_project_time(project_time_id=pt["id"],
-                                                  end=new_end)
+        pt = self.api.create_project_time(task_id=task["id"],
+                                          start=start_dt.isoformat(),
+                                          end=end_dt.isoformat())
+        self._track_project_time(pt["id"])
+        return pt, wt, task
 
-        # Verify project time was updated correctly
-        self.assertEqual(updated_pt["id"], pt["id"])
-        # Note: end time comparison is tricky due to timezone handling
+    def test_03_create_working_time(self):
+        """Test creating a working time."""
+        # The shared working time was created in setUpClass with a 30 minute pause
+        wt = self.shared_wt
 
-    def test_11_delete_project_time(self):
-        """Test deleting a project time."""
-        # Create a project time for testing
-        wt = self._get_or_create_working_time()
-        task = self._get_bookable_task()
+        # Verify working time was created correctly
+        self.assertIn("id", wt)
+        self.assertIn("start", wt)
+        self.assertIn("end", wt)
+        self.assertEqual(wt["break_time_total_minutes"], 30)
 
-        start = wt["start"]
-        end_dt = datetime.datetime.fromisoformat(start.replace('Z', '+00:00')) + datetime.timedelta(minutes=30)
-        end = end_dt.isoformat()
+        logger.info("Created working time: %s", wt['id'])
 
-        pt = self.api.create_project_time(task_id=task["id"], start=start, end=end)
-        self._track_project_time(pt["id"])
+    def test_04_get_working_times(self):
+        """Test getting working times for a date."""
+        # Get working times for the test date
+        working_times = self.api.get_working_times(start_date=self.test_date,
+                                                  end_date=self.test_date,
+                                                  user_id=self.user_id)
 
-        # Delete project time
-        response = self.api.delete_project_time(pt["id"])
+        # Verify we got at least one working time
+        self.assertGreaterEqual(len(working_times), 1)
 
-        # Remove from test data since we deleted it
-        self.created_project_times.discard(pt["id"])
+        # Verify the shared test working time is in the results
+        wt_ids = {wt.get("id") for wt in working_times}
+        self.assertIn(self.shared_wt["id"], wt_ids, "The test working time should be found")
 
-        # Verify deletion
-        with self.assertRaises(TimrApiError):
-            self.api.get_project_time(pt["id"])
+    def test_05_working_time_lifecycle(self):
+        """Test creating, fetching, updating and deleting one working time."""
+        # Create a working time of its own, never touching the shared one
+        wt = self.api.create_working_time(start=self.TS.t1000, end=self.TS.t1600, pause_duration=30)
+        self._track_working_time(wt["id"])
+        wt_id = wt["id"]
 
-    def test_12_delete_working_time(self):
-        """Test deleting a working time."""
-        # Create a working time specifically for deletion testing
-        start = f"{self.test_date_str}T10:00:00+00:00"
-        end = f"{self.test_date_str}T16:00:00+00:00"
-        pause_duration = 30
+        # Fetch it individually
+        wt_check = self.api.get_working_time(wt_id)
+        self.assertEqual(wt_check["id"], wt_id)
+        self.assertEqual(wt_check["break_time_total_minutes"], 30)
 
-        wt = self.api.create_working_time(start=start, end=end, pause_duration=pause_duration)
-        self._track_working_time(wt["id"])
+        # Update end and pause
+        new_end = self.TS.t1800
+        new_pause = 45
+        logger.info("TEST_05: Updating %s with new_end=%s, new_pause=%s", wt_id, new_end, new_pause)
+
+        updated_wt = self.api.update_working_time(working_time_id=wt_id,
+                                                 end=new_end,
+                                                 pause_duration=new_pause)
+
+        self.assertEqual(updated_wt["id"], wt_id)
+        self.assertEqual(updated_wt["break_time_total_minutes"], new_pause)
+        self._assert_iso_equal(updated_wt["end"], new_end)
+
+        # Delete it; a successful DELETE returns without raising
+        response = self.api.delete_working_time(wt_id)
+        self.assertIsInstance(response, dict)
+
+        if FULL_VERIFY:
+            with self.assertRaises(TimrApiError):
+                self.api.get_working_time(wt_id)
+
+    def test_06_project_time_lifecycle(self):
+        """Test creating, updating and deleting one project time."""
+        # Create a one hour project time at the start of the shared working time
+        pt, wt, task = self._create_project_time_for(duration_minutes=60)
+        pt_id = pt["id"]
 
-        # Delete working time
-        response = self.api.delete_working_time(wt["id"])
+        # Verify project time was created correctly
+        self.assertIn("start", pt)
+        self.assertIn("end", pt)
+        self.assertEqual(pt["task"]["id"], task["id"])
+        logger.info("Created project time: %s", pt_id)
+
+        # Extend it by 30 minutes
+        new_end = (_parse_iso(pt["end"]) + datetime.timedelta(minutes=30)).isoformat()
+        updated_pt = self.api.update_project_time(project_time_id=pt_id, end=new_end)
+
+        self.assertEqual(updated_pt["id"], pt_id)
+        self._assert_iso_equal(updated_pt["end"], new_end)
+
+        # Delete it; a successful DELETE returns without raising
+        response = self.api.delete_project_time(pt_id)
+        self.assertIsInstance(response, dict)
+
+        if FULL_VERIFY:
+            with self.assertRaises(TimrApiError):
+                self.api.get_project_time(pt_id)
+
+    def test_09_get_project_times(self):
+        """Test getting project times."""
+        # Get project times for the test date
+        project_times = self.api.get_project_times(start_date=self.test_date,
+                                                   end_date=self.test_date,
+                                                   user_id=self.user_id)
 
-        # Remove from test data since we deleted it
-        self.created_working_times.discard(wt["id"])
+        # Verify we got at least one project time
+        self.assertGreaterEqual(len(project_times), 1)
 
-        # Verify deletion
-        with self.assertRaises(TimrApiError):
-            self.api.get_working_time(wt["id"])
+        # Verify the shared test project time is in the results
+        pt_ids = {pt.get("id") for pt in project_times}
+        self.assertIn(self.shared_pt["id"], pt_ids, "The test project time should be found")
 
     def test_13_overlapping_project_times(self):
         """Test how the API handles overlapping project times.
 
         This is an important test to understand the real API behavior regarding overlapping project times.
         """
-        # Get a working time for testing
-        wt = self._get_or_create_working_time()
-
-        # Get a task for testing
-        task = self._get_bookable_task()
-
-        # Create first project time
-        start1 = wt["start"]
-        end1_dt = datetime.datetime.fromisoformat(start1.replace('Z', '+00:00')) + datetime.timedelta(hours=2)
-        end1 = end1_dt.isoformat()
-
-        pt1 = self.api.create_project_time(task_id=task["id"], start=start1, end=end1)
-        self._track_project_time(pt1["id"])
+        # Create a first, two hour project time at the start of the test working time
+        pt1, wt, task = self._create_project_time_for(duration_minutes=120)
 
         # Create second project time that overlaps with the first
-        start2_dt = datetime.datetime.fromisoformat(start1.replace('Z', '+00:00')) + datetime.timedelta(hours=1)
+        start2_dt = self.WT_START_DT + datetime.timedelta(hours=1)
         start2 = start2_dt.isoformat()
         end2_dt = start2_dt + datetime.timedelta(hours=2)
         end2 = end2_dt.isoformat()
@@ -408,7 +573,7 @@ class TimrAPIIntegrationTest(unittest.TestCase):
 
         except TimrApiError as e:
             # If we get here, the API rejected the overlapping project time
-            logger.info(f"API rejected overlapping project time: {e}")
+            logger.info("API rejected overlapping project time: %s", e)
             # This is acceptable behavior - just verify the first project time still exists
             pt1_check = self.api.get_project_time(pt1["id"])
             self.assertEqual(pt1_check["id"], pt1["id"])
@@ -419,14 +584,11 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         This is an important test to understand the real API behavior regarding project times
         that start before or end after their working time.
         """
-        # Get a working time for testing
-        wt = self._get_or_create_working_time()
-
-        # Get a task for testing
-        task = self._get_bookable_task()
+        # Use the shared working time bounds and task
+        task = self.shared_task
 
         # Try to create a project time that starts before the working time
-        wt_start = datetime.datetime.fromisoformat(wt["start"].replace('Z', '+00:00'))
+        wt_start = self.WT_START_DT
         early_start = (wt_start - datetime.timedelta(hours=1)).isoformat()
         early_end = wt_start.isoformat()
 
@@ -439,11 +601,11 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         early_pt_check = self.api.get_project_time(early_pt["id"])
         self.assertEqual(early_pt_check["id"], early_pt["id"])
         self.assertEqual(early_pt_check["task"]["id"], task["id"])
-        self.assertTrue(early_pt_check["start"] < wt["start"], 
-                       "Project time should start before working time")
+        self.assertLess(_parse_iso(early_pt_check["start"]), wt_start,
+                        "Project time should start before working time")
 
         # Create a project time that ends after the working time
-        wt_end = datetime.datetime.fromisoformat(wt["end"].replace('Z', '+00:00'))
+        wt_end = self.WT_END_DT
         late_start = wt_end.isoformat()
         late_end = (wt_end + datetime.timedelta(hours=1)).isoformat()
 
@@ -455,12 +617,11 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         late_pt_check = self.api.get_project_time(late_pt["id"])
         self.assertEqual(late_pt_check["id"], late_pt["id"])
         self.assertEqual(late_pt_check["task"]["id"], task["id"])
-        self.assertTrue(late_pt_check["end"] > wt["end"], 
-                       "Project time should end after working time")
+        self.assertGreater(_parse_iso(late_pt_check["end"]), wt_end,
+                           "Project time should end after working time")
 
         # Create a project time that spans beyond both boundaries
-        span_start = (datetime.datetime.fromisoformat(wt["start"].replace('Z', '+00:00')) - 
-                     datetime.timedelta(minutes=30)).isoformat()
+        span_start = (wt_start - datetime.timedelta(minutes=30)).isoformat()
         span_end = (wt_end + datetime.timedelta(minutes=30)).isoformat()
         
         span_pt = self.api.create_project_time(task_id=task["id"], start=span_start, end=span_end)
@@ -475,102 +636,21 @@ class TimrAPIIntegrationTest(unittest.TestCase):
         # Final verification: all boundary tests should pass since Timr allows independence
         self.assertTrue(True, "All boundary tests passed - Timr allows project times independent of working times")
 
-    def test_15_pagination_functionality(self):
-        """Test centralized pagination implementation with cursor pagination.
-        
-        This test validates that the _request_paginated method correctly handles
-        Timr's cursor pagination and retrieves unique data on each page.
-        """
-        # Test pagination with tasks (usually has many results)
-        all_tasks = self.api.get_tasks()
-        
-        # Verify we got some tasks
-        self.assertGreater(len(all_tasks), 0, "Should retrieve at least one task")
-        
-        # Test that pagination is working by checking if we have unique IDs
-        task_ids = [task["id"] for task in all_tasks]
-        unique_task_ids = set(task_ids)
-        
-        self.assertEqual(
-            len(task_ids), 
-            len(unique_task_ids), 
-            "Pagination should not return duplicate task IDs"
-        )
-        
-        logger.info(f"Pagination test: Retrieved {len(all_tasks)} unique tasks")
-
-    def test_16_pagination_data_integrity(self):
-        """Test that pagination maintains data integrity and returns different pages."""
-        # Test pagination manually to verify different pages contain different data
-        import copy
-        
-        # Make direct paginated requests to verify page differences
-        endpoint = "project-times"
-        params = {
-            "user_id": self.user_id,
-            "start_date": (self.test_date - datetime.timedelta(days=30)).strftime('%Y-%m-%d'),
-            "end_date": self.test_date.strftime('%Y-%m-%d')
-        }
-        
-        # Get first page
-        page1_params = copy.deepcopy(params)
-        page1_params['limit'] = 50
-        page1_response = self.api._request("GET", endpoint, params=page1_params)
-        page1_data = page1_response.get('data', [])
-        
-        if len(page1_data) >= 50:  # Only test if we have enough data for pagination
-            # Get second page using page_token
-            page_token = page1_response.get('page_token')
-            if page_token:
-                page2_params = copy.deepcopy(params)
-                page2_params['limit'] = 50
-                page2_params['page_token'] = page_token
-                page2_response = self.api._request("GET", endpoint, params=page2_params)
-                page2_data = page2_response.get('data', [])
-                
-                # Verify pages contain different data
-                page1_ids = {item['id'] for item in page1_data}
-                page2_ids = {item['id'] for item in page2_data}
-                
-                self.assertGreater(len(page1_ids), 0, "First page should contain data")
-                self.assertGreater(len(page2_ids), 0, "Second page should contain data")
-                
-                # Critical test: pages should not contain duplicate items
-                overlap = page1_ids.intersection(page2_ids)
-                self.assertEqual(len(overlap), 0, 
-                    f"Pages should not contain duplicate items, but found {len(overlap)} overlapping IDs")
-                
-                logger.info(f"Pagination integrity verified: Page 1 has {len(page1_ids)} items, "
-                           f"Page 2 has {len(page2_ids)} items, no overlap")
-            else:
-                logger.info("No page_token returned - only one page of data available")
-        else:
-            logger.info(f"Insufficient data for pagination test ({len(page1_data)} items)")
-        
-        # Verify data structure integrity for any returned data
-        all_data = page1_data
-        for item in all_data:
-            self.assertIn("id", item, "Project time should have an ID")
-            self.assertIn("start", item, "Project time should have a start time")
-            self.assertIn("end", item, "Project time should have an end time")
-        
-        logger.info(f"Data integrity test: {len(all_data)} project times validated")
-
     def test_17_overlapping_working_times(self):
         """Test how the API handles overlapping working times.
 
         This is an important test to understand the real API behavior regarding overlapping working times.
         """
         # Create first working time
-        start1 = f"{self.test_date_str}T10:00:00+00:00"
-        end1 = f"{self.test_date_str}T14:00:00+00:00"
+        start1 = self.TS.t1000
+        end1 = self.TS.t1400
 
         wt1 = self.api.create_working_time(start=start1, end=end1)
         self._track_working_time(wt1["id"])
 
         # Create second working time that overlaps with the first
-        start2 = f"{self.test_date_str}T12:00:00+00:00"  # Start in the middle of the first working time
-        end2 = f"{self.test_date_str}T16:00:00+00:00"  # End after the first working time
+        start2 = self.TS.t1200  # Start in the middle of the first working time
+        end2 = self.TS.t1600  # End after the first working time
 
         # Try to create the overlapping working time
         try:
@@ -589,10 +669,13 @@ class TimrAPIIntegrationTest(unittest.TestCase):
 
         except TimrApiError as e:
             # If we get here, the API rejected the overlapping working time
-            logger.info(f"API rejected overlapping working time: {e}")
+            logger.info("API rejected overlapping working time: %s", e)
             # This is acceptable behavior - just verify the first working time still exists
             wt1_check = self.api.get_working_time(wt1["id"])
             self.assertEqual(wt1_check["id"], wt1["id"])
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     unittest.main()
\ No newline at end of file
@@ -2,6 +2,8 @@ import unittest
 import os
 import datetime
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from timr_api import TimrApi, TimrApiError
 from timr_utils import ProjectTimeConsolidator, UIProjectTime
 from config import COMPANY_ID
@@ -12,6 +14,19 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Task known to accept bookings on the test account (3695 CR)
+KNOWN_BOOKABLE_TASK_ID = "11e9c44e-9af2-4b1d-87b4-d85145dbbb55"
+
+
+def _iso_seconds_of_day(value):
+    """Seconds since midnight of a 'YYYY-MM-DDTHH:MM:SS<offset>' timestamp, or None for other formats."""
+    if len(value) < 19 or value[10] != "T" or value[13] != ":" or value[16] != ":":
+        return None
+    try:
+        return int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+    except ValueError:
+        return None
+
 
 class EnhancedTimrIntegrationTest(unittest.TestCase):
     """
@@ -38,14 +53,22 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
                 "Skipping enhanced integration tests: Set TIMR_USER and TIMR_PASSWORD environment variables to run"
             )
 
-        # Initialize API client and consolidator
+        # Initialize API client and consolidator; all requests share the pooled keep-alive session
         cls.api = TimrApi(company_id=COMPANY_ID)
         cls.consolidator = ProjectTimeConsolidator(cls.api)
 
-        # Test date (yesterday to avoid API restrictions)
-        yesterday = datetime.date.today() - datetime.timedelta(days=1)
-        cls.test_date = yesterday
-        cls.test_date_str = yesterday.strftime("%Y-%m-%d")
+        # Test date in the past to avoid API restrictions. test_timr_api_integration.py
+        # books into yesterday, so this suite uses the day before: the consolidated
+        # views asserted here then don't see the other suite's entries when both run
+        # concurrently
+        test_date = datetime.date.today() - datetime.timedelta(days=2)
+        cls.test_date = test_date
+        cls.test_date_str = test_date.strftime("%Y-%m-%d")
+
+        # Timestamps used by the working time and bookability probe helpers
+        cls.START_ISO = f"{cls.test_date_str}T09:00:00+00:00"
+        cls.END_ISO = f"{cls.test_date_str}T17:00:00+00:00"
+        cls.PROBE_END_ISO = f"{cls.test_date_str}T09:01:00+00:00"
 
         # Login to Timr API
         try:
@@ -57,12 +80,41 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         except TimrApiError as e:
             raise unittest.SkipTest(f"Could not login to Timr API: {e}")
 
+        # Task lists keyed by active_only; tasks don't change during the run
+        cls._tasks_cache = {}
+
+        # Bookability probe results keyed by task ID
+        cls._bookable_cache = {KNOWN_BOOKABLE_TASK_ID: True}
+
         # Test data to clean up
-        cls.test_working_times = []
-        cls.test_project_times = []
+        cls.test_working_times = set()
+        cls.test_project_times = set()
 
-        # Performance tracking
-        cls.api_call_counts = {}
+        # One working time shared by all tests; setUp deletes the project times tests created in it
+        cls.shared_working_time = cls.api.create_working_time(
+            start=cls.START_ISO,
+            end=cls.END_ISO,
+            pause_duration=30)
+        cls.test_working_times.add(cls.shared_working_time["id"])
+
+        try:
+            # Performance tracking; the response hook counts every HTTP request of the client
+            cls.api_call_counts = {}
+            cls._api_call_count = 0
+            cls._api_call_lock = threading.Lock()
+            cls.api.session.hooks["response"].append(cls._record_api_call)
+
+            # Up to 5 bookable tasks among the first 10 active ones, probed once for all tests
+            cls.bookable_tasks = []
+            for task in cls._get_tasks_cached()[:10]:
+                if cls._find_bookable_task([task]):
+                    cls.bookable_tasks.append(task)
+                    if len(cls.bookable_tasks) == 5:
+                        break
+        except Exception:
+            # tearDownClass isn't called when setUpClass fails, so clean up here
+            cls.tearDownClass()
+            raise
 
     @classmethod
     def tearDownClass(cls):
@@ -72,44 +124,65 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
 
         cleanup_summary = {"working_times": 0, "project_times": 0, "errors": 0}
 
-        # Delete all test project times first (before working times to avoid FK constraints)
-        for pt_id in cls.test_project_times:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            # Delete all test project times first (before working times to avoid FK constraints)
+            cls._delete_concurrently(pool, cls.test_project_times, cls.api.delete_project_time,
+                                     "project time", "project_times", cleanup_summary)
+
+            # Delete all test working times (this should also delete associated project times)
+            cls._delete_concurrently(pool, cls.test_working_times, cls.api.delete_working_time,
+                                     "working time", "working_times", cleanup_summary)
+
+        cls.api.session.close()
+
+        logger.info("Enhanced test cleanup complete: %d working times, %d project times deleted. "
+                    "%d errors encountered.", cleanup_summary["working_times"],
+                    cleanup_summary["project_times"], cleanup_summary["errors"])
+
+    @staticmethod
+    def _delete_concurrently(pool, entry_ids, delete_func, label, summary_key, cleanup_summary):
+        """Delete entries on the pool; returns once all deletes have finished."""
+        # Drain the tracking set while submitting; failed ids are put back
+        futures = {}
+        while entry_ids:
+            entry_id = entry_ids.pop()
+            futures[pool.submit(delete_func, entry_id)] = entry_id
+        # Results are collected on this thread, so the summary and the set need no lock
+        for future in as_completed(futures):
+            entry_id = futures[future]
             try:
-                cls.api.delete_project_time(pt_id)
-                logger.info(f"Deleted test project time {pt_id}")
-                cleanup_summary["project_times"] += 1
+                future.result()
+                logger.debug("Deleted test %s %s", label, entry_id)
+                cleanup_summary[summary_key] += 1
             except TimrApiError as e:
-                logger.warning(f"Could not delete test project time {pt_id}: {e}")
+                logger.warning("Could not delete test %s %s: %s", label, entry_id, e)
+                entry_ids.add(entry_id)
                 cleanup_summary["errors"] += 1
 
-        # Delete all test working times (this should also delete associated project times)
-        for wt_id in cls.test_working_times:
-            try:
-                cls.api.delete_working_time(wt_id)
-                logger.info(f"Deleted test working time {wt_id}")
-                cleanup_summary["working_times"] += 1
-            except TimrApiError as e:
-                logger.warning(f"Could not delete test working time {wt_id}: {e}")
-                cleanup_summary["errors"] += 1
-
-        logger.info(f"Enhanced test cleanup complete: {cleanup_summary['working_times']} working times, "
-                   f"{cleanup_summary['project_times']} project times deleted. "
-                   f"{cleanup_summary['errors']} errors encountered.")
+    @classmethod
+    def _get_tasks_cached(cls, active_only=True):
+        """Return the task list, fetching it only once per class and active_only value."""
+        if active_only not in cls._tasks_cache:
+            cls._tasks_cache[active_only] = cls.api.get_tasks(active_only=active_only)
+        return cls._tasks_cache[active_only]
 
     def _track_working_time(self, working_time_id):
         """Track a working time for cleanup, avoiding duplicates."""
         if working_time_id not in self.test_working_times:
-            self.test_working_times.append(working_time_id)
-            logger.debug(f"Tracking working time for cleanup: {working_time_id}")
+            self.test_working_times.add(working_time_id)
+            logger.debug("Tracking working time for cleanup: %s", working_time_id)
 
-    def _track_project_time(self, project_time_id):
+    @classmethod
+    def _track_project_time(cls, project_time_id):
         """Track a project time for cleanup, avoiding duplicates."""
-        if project_time_id not in self.test_project_times:
-            self.test_project_times.append(project_time_id)
-            logger.debug(f"Tracking project time for cleanup: {project_time_id}")
+        if project_time_id not in cls.test_project_times:
+            cls.test_project_times.add(project_time_id)
+            logger.debug("Tracking project time for cleanup: %s", project_time_id)
 
     def setUp(self):
-        """Set up each test with API call tracking."""
+        """Set up each test with the suite's project times removed and API call tracking."""
+        self._clear_project_times()
+
         # Reset API call tracking
         self.initial_api_calls = self._count_recent_api_calls()
 
@@ -120,31 +193,25 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         api_calls_made = max(0, final_api_calls - self.initial_api_calls)
         self.api_call_counts[test_name] = api_calls_made
         logger.info(
-            f"Test {test_name} made approximately {api_calls_made} API calls")
+            f"Test {test_name} made {api_calls_made} API calls")
+
+    @classmethod
+    def _record_api_call(cls, response, *args, **kwargs):
+        """Session response hook counting API calls; cleanup threads call it concurrently."""
+        with cls._api_call_lock:
+            cls._api_call_count += 1
 
     def _count_recent_api_calls(self):
-        """Rough approximation of API calls made (for performance tracking)."""
-        # This is a rough proxy - in reality you'd need proper monitoring
-        # For now, we just track method calls on our API client
-        return getattr(self.api, '_api_call_count', 0)
+        """Number of API calls made so far (for performance tracking)."""
+        return self._api_call_count
 
     def test_01_incremental_add_single_task(self):
         """Test adding a single task using incremental updates."""
         # Create a working time for testing
         working_time = self._create_test_working_time()
 
-        # Clean up any existing project times to ensure test isolation
-        existing_project_times = self.api._get_project_times_in_work_time(
-            working_time)
-        for pt in existing_project_times:
-            if pt.get("id"):
-                try:
-                    self.api.delete_project_time(pt["id"])
-                except TimrApiError:
-                    pass  # Ignore deletion errors
-
         # Get available tasks
-        tasks = self.api.get_tasks()[:5]  # Get first 5 tasks
+        tasks = self._get_tasks_cached()[:5]  # Get first 5 tasks
         if not tasks:
             self.skipTest("No tasks available for testing")
 
@@ -158,7 +225,7 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             bookable_task = tasks[0]  # Use first task as fallback
 
         # Add a single task using incremental update
-        result = self.consolidator.add_ui_project_time(
+        result = self._add_and_track(
             working_time=working_time,
             task_id=bookable_task["id"],
             task_name=bookable_task["name"],
@@ -181,24 +248,18 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         project_times = self.api._get_project_times_in_work_time(working_time)
         self.assertGreater(len(project_times), 0)
 
-        # Track created project times for cleanup
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
-
     def test_02_incremental_update_existing_task(self):
         """Test updating an existing task using incremental updates."""
         # Create a working time with an initial task
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks()[:2]
-        if len(tasks) < 1:
-            self.skipTest("Not enough tasks available for testing")
+        if not self.bookable_tasks:
+            self.skipTest("No bookable tasks available for testing")
 
-        bookable_task = self._find_bookable_task(tasks)
+        bookable_task = self.bookable_tasks[0]
 
         # Add initial task
-        self.consolidator.add_ui_project_time(
+        self._add_and_track(
             working_time=working_time,
             task_id=bookable_task["id"],
             task_name=bookable_task["name"],
@@ -206,11 +267,11 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         )
 
         # Update the task duration
-        result = self.consolidator.update_ui_project_time(
+        result = self._track_result(self.consolidator.update_ui_project_time(
             working_time=working_time,
             task_id=bookable_task["id"],
             duration_minutes=180,  # Change to 3 hours
-            task_name=bookable_task["name"])
+            task_name=bookable_task["name"]))
 
         # Verify the update
         self.assertEqual(len(result['ui_project_times']), 1)
@@ -223,27 +284,21 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             if pt.get('task', {}).get('id') == bookable_task["id"])
         self.assertEqual(total_duration, 180)
 
-        # Track for cleanup
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
-
     def test_03_incremental_delete_task(self):
         """Test deleting a task using incremental updates."""
         # Create a working time with a task
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks(active_only=False)  # Get all tasks, not just active ones
+        tasks = self._get_tasks_cached(active_only=False)  # Get all tasks, not just active ones
         if len(tasks) < 1:
             self.skipTest("Not enough tasks available for testing")
 
         # Find one bookable task - prioritize known working tasks first
-        known_working_task_id = "11e9c44e-9af2-4b1d-87b4-d85145dbbb55"  # 3695 CR - known to work
         bookable_task = None
         
         # First try to find the known working task
         for task in tasks:
-            if task.get("id") == known_working_task_id and task.get("bookable") is not False:
+            if task.get("id") == KNOWN_BOOKABLE_TASK_ID and task.get("bookable") is not False:
                 bookable_task = task
                 break
                 
@@ -255,7 +310,7 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             self.skipTest("Could not find any bookable tasks for testing")
 
         # Add the task
-        result = self.consolidator.add_ui_project_time(
+        result = self._add_and_track(
             working_time=working_time,
             task_id=bookable_task["id"],
             task_name=bookable_task["name"],
@@ -278,23 +333,12 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         task_ids = [pt.get('task', {}).get('id') for pt in project_times]
         self.assertNotIn(bookable_task["id"], task_ids)
 
-        # Track remaining project times for cleanup
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
-
     def test_04_incremental_vs_full_replacement_efficiency(self):
         """Test that incremental updates are more efficient than full replacement."""
         # Create working time with multiple tasks
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks()[:3]
-        if len(tasks) < 3:
-            self.skipTest("Not enough tasks available for testing")
-
-        bookable_tasks = [self._find_bookable_task([task]) for task in tasks]
-        bookable_tasks = [task for task in bookable_tasks if task is not None]
-        
+        bookable_tasks = self.bookable_tasks[:3]
         if len(bookable_tasks) < 3:
             self.skipTest("Not enough bookable tasks available for testing")
 
@@ -302,11 +346,10 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         initial_call_count = self._count_recent_api_calls()
 
         for i, task in enumerate(bookable_tasks):
-            self.consolidator.add_ui_project_time(working_time=working_time,
-                                                  task_id=task["id"],
-                                                  task_name=task["name"],
-                                                  duration_minutes=60 *
-                                                  (i + 1))
+            self._add_and_track(working_time=working_time,
+                                task_id=task["id"],
+                                task_name=task["name"],
+                                duration_minutes=60 * (i + 1))
 
         incremental_calls = self._count_recent_api_calls() - initial_call_count
 
@@ -317,46 +360,37 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         ]
 
         # Clear existing and use full replacement
-        self.api._delete_existing_project_times(working_time)
+        self._clear_project_times()
 
         full_replacement_start = self._count_recent_api_calls()
-        self.consolidator.replace_ui_project_times(working_time,
-                                                   ui_project_times)
+        self._track_result(
+            self.consolidator.replace_ui_project_times(working_time,
+                                                       ui_project_times))
         full_replacement_calls = self._count_recent_api_calls(
         ) - full_replacement_start
 
-        logger.info(f"Incremental approach: ~{incremental_calls} calls")
+        logger.info(f"Incremental approach: {incremental_calls} calls")
         logger.info(
-            f"Full replacement approach: ~{full_replacement_calls} calls")
-
-        # Incremental should be more efficient for small changes
-        # Note: This may not always be true due to the nature of our differential algorithm
-        # but it demonstrates the concept
+            f"Full replacement approach: {full_replacement_calls} calls")
 
-        # Clean up project times
-        project_times = self.api._get_project_times_in_work_time(working_time)
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
+        # Both approaches must have reached the API. Adding tasks one by one re-reads
+        # the working time on each add, so incremental isn't cheaper when building
+        # from scratch; it pays off for small changes to an existing allocation
+        self.assertGreater(incremental_calls, 0)
+        self.assertGreater(full_replacement_calls, 0)
 
     def test_05_complex_incremental_scenario(self):
         """Test a complex scenario with multiple incremental operations."""
         # Create working time
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks()[:4]
-        if len(tasks) < 4:
-            self.skipTest("Not enough tasks available for testing")
-
-        bookable_tasks = [self._find_bookable_task([task]) for task in tasks]
-        bookable_tasks = [task for task in bookable_tasks if task is not None]
-        
+        bookable_tasks = self.bookable_tasks[:4]
         if len(bookable_tasks) < 4:
             self.skipTest("Not enough bookable tasks available for testing")
 
         # Phase 1: Add three tasks
         for i, task in enumerate(bookable_tasks[:3]):
-            self.consolidator.add_ui_project_time(
+            self._add_and_track(
                 working_time=working_time,
                 task_id=task["id"],
                 task_name=task["name"],
@@ -364,18 +398,18 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             )
 
         # Phase 2: Update middle task duration
-        self.consolidator.update_ui_project_time(
+        self._track_result(self.consolidator.update_ui_project_time(
             working_time=working_time,
             task_id=bookable_tasks[1]["id"],
             duration_minutes=90  # Change from 2h to 1.5h
-        )
+        ))
 
         # Phase 3: Delete first task
         self.consolidator.delete_ui_project_time(
             working_time=working_time, task_id=bookable_tasks[0]["id"])
 
         # Phase 4: Add new task
-        result = self.consolidator.add_ui_project_time(
+        result = self._add_and_track(
             working_time=working_time,
             task_id=bookable_tasks[3]["id"],
             task_name=bookable_tasks[3]["name"],
@@ -386,48 +420,31 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         self.assertEqual(len(result['ui_project_times']), 3)
 
         # Check that we have the expected tasks
-        final_task_ids = [
-            ui_pt.task_id for ui_pt in result['ui_project_times']
-        ]
-        self.assertNotIn(bookable_tasks[0]["id"], final_task_ids)  # Deleted
-        self.assertIn(bookable_tasks[1]["id"], final_task_ids)  # Updated
-        self.assertIn(bookable_tasks[2]["id"], final_task_ids)  # Unchanged
-        self.assertIn(bookable_tasks[3]["id"], final_task_ids)  # Added
+        final_by_task = self._index_by_task_id(result['ui_project_times'])
+        self.assertNotIn(bookable_tasks[0]["id"], final_by_task)  # Deleted
+        self.assertIn(bookable_tasks[1]["id"], final_by_task)  # Updated
+        self.assertIn(bookable_tasks[2]["id"], final_by_task)  # Unchanged
+        self.assertIn(bookable_tasks[3]["id"], final_by_task)  # Added
 
         # Verify durations
-        task1_duration = next(ui_pt.duration_minutes
-                              for ui_pt in result['ui_project_times']
-                              if ui_pt.task_id == bookable_tasks[1]["id"])
-        self.assertEqual(task1_duration, 90)  # Updated duration
-
-        # Clean up
-        project_times = self.api._get_project_times_in_work_time(working_time)
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
+        self.assertEqual(final_by_task[bookable_tasks[1]["id"]].duration_minutes, 90)  # Updated duration
 
     def test_06_incremental_updates_preserve_data_integrity(self):
         """Test that incremental updates maintain data integrity."""
         # Create working time
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks()[:2]
-        if len(tasks) < 2:
-            self.skipTest("Not enough tasks available for testing")
-
-        bookable_tasks = [self._find_bookable_task([task]) for task in tasks]
-        bookable_tasks = [task for task in bookable_tasks if task is not None]
-        
+        bookable_tasks = self.bookable_tasks[:2]
         if len(bookable_tasks) < 2:
             self.skipTest("Not enough bookable tasks available for testing")
 
         # Add tasks with specific durations
         durations = [90, 120]  # 1.5h, 2h
         for task, duration in zip(bookable_tasks, durations):
-            self.consolidator.add_ui_project_time(working_time=working_time,
-                                                  task_id=task["id"],
-                                                  task_name=task["name"],
-                                                  duration_minutes=duration)
+            self._add_and_track(working_time=working_time,
+                                task_id=task["id"],
+                                task_name=task["name"],
+                                duration_minutes=duration)
 
         # Get the consolidated view
         consolidated = self.consolidator.consolidate_project_times(
@@ -438,11 +455,9 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         self.assertEqual(consolidated['total_duration'], expected_total)
 
         # Verify individual task durations are preserved
-        for ui_pt in consolidated['ui_project_times']:
-            expected_duration = durations[bookable_tasks.index(
-                next(task for task in bookable_tasks
-                     if task["id"] == ui_pt.task_id))]
-            self.assertEqual(ui_pt.duration_minutes, expected_duration)
+        self._assert_state(consolidated, {
+            task["id"]: duration for task, duration in zip(bookable_tasks, durations)
+        })
 
         # Verify project times in Timr match expected durations
         project_times = self.api._get_project_times_in_work_time(working_time)
@@ -450,35 +465,26 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             self._calculate_project_time_duration(pt) for pt in project_times)
         self.assertEqual(timr_total_duration, expected_total)
 
-        # Clean up
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
-
     def test_07_error_recovery_in_incremental_updates(self):
         """Test error recovery mechanisms in incremental updates."""
         # Create working time
         working_time = self._create_test_working_time()
 
-        tasks = self.api.get_tasks()[:1]
-        if not tasks:
-            self.skipTest("No tasks available for testing")
-
-        bookable_task = self._find_bookable_task(tasks)
-        
-        if not bookable_task:
+        if not self.bookable_tasks:
             self.skipTest("No bookable tasks available for testing")
 
+        bookable_task = self.bookable_tasks[0]
+
         # Add a valid task first
-        self.consolidator.add_ui_project_time(working_time=working_time,
-                                              task_id=bookable_task["id"],
-                                              task_name=bookable_task["name"],
-                                              duration_minutes=60)
+        self._add_and_track(working_time=working_time,
+                            task_id=bookable_task["id"],
+                            task_name=bookable_task["name"],
+                            duration_minutes=60)
 
         # Try to add an invalid task (non-existent task ID)
         # This should either fail gracefully or fall back to full replacement
         try:
-            result = self.consolidator.add_ui_project_time(
+            result = self._add_and_track(
                 working_time=working_time,
                 task_id="non-existent-task-id",
                 task_name="Non-existent Task",
@@ -494,17 +500,59 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
             self.assertEqual(consolidated['ui_project_times'][0].task_id,
                              bookable_task["id"])
 
-        # Clean up
-        project_times = self.api._get_project_times_in_work_time(working_time)
-        for pt in project_times:
-            if pt.get("id"):
-                self.test_project_times.append(pt["id"])
-
     # Helper methods
-    def _create_test_working_time(self):
-        """Create a test working time and track it for cleanup."""
-        start = f"{self.test_date_str}T09:00:00+00:00"
-        end = f"{self.test_date_str}T17:00:00+00:00"
+    @classmethod
+    def _clear_project_times(cls):
+        """Delete the project times this suite created; entries that are already gone are skipped.
+
+        Only tracked IDs are deleted, never other project times in the test slot,
+        as those may be real bookings or fixtures of another suite.
+        """
+        failed_ids = set()
+        while cls.test_project_times:
+            project_time_id = cls.test_project_times.pop()
+            try:
+                cls.api.delete_project_time(project_time_id)
+            except TimrApiError as e:
+                if e.status_code != 404:
+                    logger.warning("Could not delete project time %s: %s", project_time_id, e)
+                    failed_ids.add(project_time_id)
+        # Keep failed deletes for tearDownClass to retry
+        cls.test_project_times.update(failed_ids)
+
+    @staticmethod
+    def _index_by_task_id(ui_project_times):
+        """Map task IDs to their UI project times."""
+        return {ui_pt.task_id: ui_pt for ui_pt in ui_project_times}
+
+    def _assert_state(self, result, expected):
+        """Assert that a consolidator result holds exactly the expected durations by task ID."""
+        actual = {task_id: ui_pt.duration_minutes
+                  for task_id, ui_pt in self._index_by_task_id(result['ui_project_times']).items()}
+        self.assertEqual(actual, expected)
+
+    def _track_result(self, result):
+        """Track the project times behind a consolidator result for cleanup and return the result."""
+        for ui_pt in result['ui_project_times']:
+            for project_time_id in ui_pt.project_time_ids:
+                self._track_project_time(project_time_id)
+        return result
+
+    def _add_and_track(self, working_time, task_id, task_name, duration_minutes):
+        """Add a UI project time through the consolidator and track what it created."""
+        return self._track_result(
+            self.consolidator.add_ui_project_time(working_time=working_time,
+                                                  task_id=task_id,
+                                                  task_name=task_name,
+                                                  duration_minutes=duration_minutes))
+
+    def _create_test_working_time(self, fresh=False):
+        """Return the shared working time, or create and track a new one if fresh is set."""
+        if not fresh:
+            return self.shared_working_time
+
+        start = self.START_ISO
+        end = self.END_ISO
         pause_duration = 30
 
         wt = self.api.create_working_time(start=start,
@@ -514,50 +562,49 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
         self._track_working_time(wt["id"])
         return wt
 
-    def _find_bookable_task(self, tasks):
-        """Find a bookable task from the given list by actually testing it."""
-        # Try each task to see if we can actually book time to it
+    @classmethod
+    def _find_bookable_task(cls, tasks):
+        """Find a bookable task from the given list by actually testing it.
+
+        Probe results are memoized for the class, so each task is probed at most once.
+        """
         for task in tasks:
             # Skip tasks that are explicitly not bookable
             if task.get("bookable") is False:
                 continue
-                
-            try:
-                # Create a minimal test working time
-                test_working_time = self._create_test_working_time()
-                
-                # Try to create a minimal project time (1 minute) to test bookability
-                test_start = f"{self.test_date_str}T09:00:00+00:00" 
-                test_end = f"{self.test_date_str}T09:01:00+00:00"
-                
-                project_time = self.api.create_project_time(
-                    task_id=task["id"],
-                    start=test_start,
-                    end=test_end
-                )
-                
-                # If we got here, the task is bookable - clean up and return it
-                if project_time.get("id"):
-                    self.api.delete_project_time(project_time["id"])
-                    
-                # Clean up the test working time
-                self.api.delete_working_time(test_working_time["id"])
-                
+
+            bookable = cls._bookable_cache.get(task["id"])
+            if bookable is None:
+                bookable = cls._probe_bookable(task)
+                cls._bookable_cache[task["id"]] = bookable
+            if bookable:
                 return task
-                
-            except Exception as e:
-                # This task is not bookable (disabled, archived, etc.), try the next one
-                try:
-                    # Clean up the test working time if it was created
-                    if 'test_working_time' in locals():
-                        self.api.delete_working_time(test_working_time["id"])
-                except:
-                    pass
-                continue
-                
+
         # No bookable task found
         return None
 
+    @classmethod
+    def _probe_bookable(cls, task):
+        """Try to book a minimal project time (1 minute) on the task in the shared working time."""
+        test_start = cls.START_ISO
+        test_end = cls.PROBE_END_ISO
+
+        try:
+            project_time = cls.api.create_project_time(task_id=task["id"],
+                                                        start=test_start,
+                                                        end=test_end)
+        except TimrApiError as e:
+            # This task is not bookable (disabled, archived, etc.)
+            logger.debug(f"Task {task['id']} is not bookable: {e}")
+            return False
+
+        if project_time.get("id"):
+            try:
+                cls.api.delete_project_time(project_time["id"])
+            except TimrApiError:
+                cls._track_project_time(project_time["id"])
+        return True
+
     def _calculate_project_time_duration(self, project_time):
         """Calculate duration of a project time in minutes."""
         try:
@@ -565,9 +612,18 @@ class EnhancedTimrIntegrationTest(unittest.TestCase):
                     'duration'] and 'minutes' in project_time['duration']:
                 return int(project_time['duration']['minutes'])
             else:
-                start_str = project_time.get("start",
-                                             "").replace('Z', '+00:00')
-                end_str = project_time.get("end", "").replace('Z', '+00:00')
+                start_str = project_time.get("start", "")
+                end_str = project_time.get("end", "")
+
+                # Same day and offset: subtract the clock times without building datetimes
+                if start_str[:10] == end_str[:10] and start_str[19:] == end_str[19:]:
+                    start_seconds = _iso_seconds_of_day(start_str)
+                    end_seconds = _iso_seconds_of_day(end_str)
+                    if start_seconds is not None and end_seconds is not None:
+                        return int((end_seconds - start_seconds) / 60)
+
+                start_str = start_str.replace('Z', '+00:00')
+                end_str = end_str.replace('Z', '+00:00')
                 start = datetime.datetime.fromisoformat(start_str)
                 end = datetime.datetime.fromisoformat(end_str)
                 return int((end - start).total_seconds() / 60)
@@ -5,27 +5,26 @@ Tests the fix for _get_project_times_in_work_time method.
 
 import unittest
 from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
-import pytz
-import sys
-import os
-
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from datetime import datetime, timedelta, timezone
 
 from timr_api import TimrApi, _calculate_ongoing_working_time_end_for_api
 
+UTC = timezone.utc
+
+
+def _frozen_now(now):
+    """Patch ``datetime.datetime`` so that ``now()`` returns the given time while ISO parsing keeps working"""
+    return patch('datetime.datetime', **{'now.return_value': now, 'fromisoformat': datetime.fromisoformat})
+
 
 class TestOngoingProjectTimeRetrieval(unittest.TestCase):
     """Test project time retrieval for ongoing working times"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.api = TimrApi()
-        self.api.user = {"id": "test-user-id"}
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up the read-only working time and project time fixtures shared by all tests"""
         # Standard ongoing working time
-        self.ongoing_working_time = {
+        cls.ongoing_working_time = {
             "id": "ongoing-wt-id",
             "start": "2025-06-15T09:00:00+00:00",
             "end": None,  # Ongoing working time
@@ -38,7 +37,7 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
         }
         
         # Mock project times that should be found
-        self.mock_project_times = [
+        cls.mock_project_times = [
             {
                 "id": "pt1",
                 "start": "2025-06-15T09:30:00+00:00",
@@ -59,9 +58,14 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             }
         ]
 
+    def setUp(self):
+        """Give each test its own client so it can stub methods on it"""
+        self.api = TimrApi()
+        self.api.user = {"id": "test-user-id"}
+
     def test_calculate_ongoing_working_time_end_for_api_with_duration(self):
         """Test utility function calculates end time from duration"""
-        work_start = datetime(2025, 6, 15, 9, 0, 0, tzinfo=pytz.UTC)
+        work_start = datetime(2025, 6, 15, 9, 0, 0, tzinfo=UTC)
         
         result = _calculate_ongoing_working_time_end_for_api(self.ongoing_working_time, work_start)
         
@@ -76,24 +80,21 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             "end": None,
             # No duration field
         }
-        work_start = datetime(2025, 6, 15, 9, 0, 0, tzinfo=pytz.UTC)
+        work_start = datetime(2025, 6, 15, 9, 0, 0, tzinfo=UTC)
         
-        with patch('datetime.datetime') as mock_datetime:
-            mock_now = datetime(2025, 6, 15, 10, 30, 0, tzinfo=pytz.UTC)
-            mock_datetime.now.return_value = mock_now
-            mock_datetime.fromisoformat = datetime.fromisoformat
-            
+        mock_now = datetime(2025, 6, 15, 10, 30, 0, tzinfo=UTC)
+        with _frozen_now(mock_now):
             result = _calculate_ongoing_working_time_end_for_api(ongoing_no_duration, work_start)
             
             self.assertEqual(result, mock_now)
 
-    @patch.object(TimrApi, 'get_project_times')
-    def test_get_project_times_in_work_time_ongoing_working_time(self, mock_get_project_times):
+    def test_get_project_times_in_work_time_ongoing_working_time(self):
         """Test that ongoing working times can retrieve their project times"""
         # Mock the API call to return project times
-        mock_get_project_times.return_value = self.mock_project_times
+        self.api.get_project_times = Mock(return_value=self.mock_project_times)
         
         result = self.api._get_project_times_in_work_time(self.ongoing_working_time)
+        self.api.get_project_times.assert_called_once()
         
         # Should return project times that fall within the calculated working time
         # Working time: 09:00 + 120 minutes = 11:00
@@ -106,8 +107,7 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
         self.assertIn("pt2", project_time_ids)
         self.assertNotIn("pt3", project_time_ids)
 
-    @patch.object(TimrApi, 'get_project_times')
-    def test_get_project_times_in_work_time_ongoing_no_duration_fallback(self, mock_get_project_times):
+    def test_get_project_times_in_work_time_ongoing_no_duration_fallback(self):
         """Test ongoing working time without duration uses current time fallback"""
         ongoing_no_duration = {
             "id": "ongoing-wt-id",
@@ -116,14 +116,10 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             # No duration field - should use current time
         }
         
-        mock_get_project_times.return_value = self.mock_project_times
+        self.api.get_project_times = Mock(return_value=self.mock_project_times)
         
-        with patch('datetime.datetime') as mock_datetime:
-            # Mock current time to be 10:15 (75 minutes after start)
-            mock_now = datetime(2025, 6, 15, 10, 15, 0, tzinfo=pytz.UTC)
-            mock_datetime.now.return_value = mock_now
-            mock_datetime.fromisoformat = datetime.fromisoformat
-            
+        # Mock current time to be 10:15 (75 minutes after start)
+        with _frozen_now(datetime(2025, 6, 15, 10, 15, 0, tzinfo=UTC)):
             result = self.api._get_project_times_in_work_time(ongoing_no_duration)
             
             # pt1 (09:30-10:00) and pt2 (10:00-10:30) should be included
@@ -135,8 +131,22 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             self.assertIn("pt1", project_time_ids)
             self.assertIn("pt2", project_time_ids)
 
-    @patch.object(TimrApi, 'get_project_times')
-    def test_get_project_times_in_work_time_completed_working_time(self, mock_get_project_times):
+    def test_get_project_times_in_work_time_ongoing_without_project_times(self):
+        """Test that an ongoing working time without project times skips the end calculation"""
+        self.api.get_project_times = Mock(return_value=[])
+        
+        # Two days after the working time started
+        with patch('timr_api._calculate_ongoing_working_time_end_for_api') as mock_calculate_end, \
+                _frozen_now(datetime(2025, 6, 17, 8, 0, 0, tzinfo=UTC)):
+            result = self.api._get_project_times_in_work_time(self.ongoing_working_time)
+        
+        self.assertEqual(result, [])
+        mock_calculate_end.assert_not_called()
+        # Ongoing working times are queried up to today
+        self.assertEqual(self.api.get_project_times.call_args.kwargs["end_date"],
+                         datetime(2025, 6, 17).date())
+
+    def test_get_project_times_in_work_time_completed_working_time(self):
         """Test that completed working times still work correctly"""
         completed_working_time = {
             "id": "completed-wt-id",
@@ -145,7 +155,7 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             "break_time_total_minutes": 15
         }
         
-        mock_get_project_times.return_value = self.mock_project_times
+        self.api.get_project_times = Mock(return_value=self.mock_project_times)
         
         result = self.api._get_project_times_in_work_time(completed_working_time)
         
@@ -158,8 +168,7 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
         self.assertIn("pt2", project_time_ids)
         self.assertNotIn("pt3", project_time_ids)
 
-    @patch.object(TimrApi, 'get_project_times')
-    def test_get_project_times_in_work_time_error_handling(self, mock_get_project_times):
+    def test_get_project_times_in_work_time_error_handling(self):
         """Test error handling for malformed project times"""
         # Include malformed project times
         malformed_project_times = [
@@ -183,7 +192,7 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             }
         ]
         
-        mock_get_project_times.return_value = malformed_project_times
+        self.api.get_project_times = Mock(return_value=malformed_project_times)
         
         result = self.api._get_project_times_in_work_time(self.ongoing_working_time)
         
@@ -199,13 +208,24 @@ class TestOngoingProjectTimeRetrieval(unittest.TestCase):
             "end": None
         }
         
-        with patch.object(self.api, 'get_project_times') as mock_get_project_times:
-            mock_get_project_times.return_value = []
-            
-            result = self.api._get_project_times_in_work_time(invalid_working_time)
-            
-            # Should return empty list due to error handling
-            self.assertEqual(result, [])
+        self.api.get_project_times = Mock(return_value=[])
+        
+        result = self.api._get_project_times_in_work_time(invalid_working_time)
+        
+        # Should return empty list without querying the API
+        self.assertEqual(result, [])
+        self.api.get_project_times.assert_not_called()
+
+    def test_get_project_times_in_work_time_malformed_working_time(self):
+        """Test that malformed working time entries return an empty list instead of raising"""
+        self.api.get_project_times = Mock(return_value=self.mock_project_times)
+        
+        for working_time in (None, ["not", "a", "dict"], {"id": "wt", "start": ["unhashable"]},
+                             {"id": "wt", "start": "not-a-date"}):
+            with self.subTest(working_time=working_time):
+                self.assertEqual(self.api._get_project_times_in_work_time(working_time), [])
+        
+        self.api.get_project_times.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -332,6 +332,112 @@ class TestTimrApiTaskFiltering(unittest.TestCase):
             # API should only be called once due to caching (second call uses cache)
             mock_request.assert_called_once_with("GET", "/tasks/shared-parent")
 
+    def test_siblings_stop_at_already_checked_ancestors(self):
+        """Test that siblings below a checked hierarchy neither refetch nor re-walk it"""
+        grandparent = {
+            "id": "grandparent",
+            "name": "Grandparent",
+            "bookable": False,
+            "end_date": None,
+            "parent_task": None
+        }
+        parent = {
+            "id": "parent",
+            "name": "Parent",
+            "bookable": False,
+            "end_date": None,
+            "parent_task": {"id": "grandparent", "name": "Grandparent"}
+        }
+        siblings = [
+            {
+                "id": f"sibling-{index}",
+                "name": f"Sibling {index}",
+                "bookable": True,
+                "end_date": None,
+                "parent_task": {"id": "parent", "name": "Parent"}
+            }
+            for index in range(2)
+        ]
+        tasks_by_endpoint = {"/tasks/parent": parent, "/tasks/grandparent": grandparent}
+
+        with patch.object(self.api, '_request',
+                          side_effect=lambda method, endpoint: tasks_by_endpoint[endpoint]) as mock_request, \
+             patch.object(self.api, '_get_task_by_id', wraps=self.api._get_task_by_id) as mock_get_task:
+            results = [self.api._is_task_effectively_bookable(task) for task in siblings]
+
+        self.assertEqual(results, [True, True])
+        self.assertEqual(mock_request.call_count, 2)
+        # The second sibling is decided by its parent's remembered result
+        self.assertEqual(mock_get_task.call_count, 2)
+
+    def test_closed_ancestor_is_remembered_for_siblings(self):
+        """Test that a closed ancestor excludes later siblings without walking the hierarchy again"""
+        closed_parent = {
+            "id": "closed-parent",
+            "name": "Closed Parent",
+            "bookable": True,
+            "end_date": self.past_date.isoformat(),
+            "parent_task": None
+        }
+        siblings = [
+            {
+                "id": f"sibling-{index}",
+                "name": f"Sibling {index}",
+                "bookable": True,
+                "end_date": None,
+                "parent_task": {"id": "closed-parent", "name": "Closed Parent"}
+            }
+            for index in range(3)
+        ]
+
+        with patch.object(self.api, '_get_task_by_id', return_value=closed_parent) as mock_get_task:
+            results = [self.api._is_task_effectively_bookable(task) for task in siblings]
+
+        self.assertEqual(results, [False, False, False])
+        mock_get_task.assert_called_once_with("closed-parent")
+
+    def test_is_task_effectively_bookable_compares_with_given_now(self):
+        """Test that a passed-in current time is used instead of the clock"""
+        task = {
+            "id": "task-1",
+            "name": "Test Task",
+            "bookable": True,
+            "end_date": self.future_date.isoformat(),
+            "parent_task": None
+        }
+        
+        result = self.api._is_task_effectively_bookable(task, now=self.future_date + datetime.timedelta(days=1))
+        self.assertFalse(result)
+
+    def test_get_tasks_checks_each_task_once_against_one_now(self):
+        """Test that get_tasks checks each listed task's end date once, all against the same time"""
+        parent = {
+            "id": "parent",
+            "name": "Parent",
+            "bookable": False,
+            "end_date": self.future_date.isoformat(),
+            "parent_task": None
+        }
+        mock_tasks = [parent] + [
+            {
+                "id": f"child-{index}",
+                "name": f"Child Task {index}",
+                "bookable": True,
+                "end_date": self.future_date.isoformat(),
+                "parent_task": {"id": "parent", "name": "Parent"}
+            }
+            for index in range(3)
+        ]
+
+        with patch.object(self.api, '_request_paginated', return_value=mock_tasks), \
+             patch.object(self.api, '_is_task_active', wraps=self.api._is_task_active) as mock_is_active:
+            result = self.api.get_tasks(active_only=True)
+
+        self.assertEqual(len(result), 4)
+        checked_ids = [call.args[0]["id"] for call in mock_is_active.call_args_list]
+        self.assertCountEqual(checked_ids, ["parent", "child-0", "child-1", "child-2"])
+        self.assertEqual(len({id(call.args[1]) for call in mock_is_active.call_args_list}), 1)
+
     def test_parent_task_cache_is_isolated_per_get_tasks_call(self):
         """Test that parent task cache is cleared between different get_tasks calls"""
         # Create tasks that will trigger parent fetching
@@ -373,6 +479,42 @@ class TestTimrApiTaskFiltering(unittest.TestCase):
             self.assertEqual(len(result1), 1)
             self.assertEqual(len(result2), 1)
 
+    def test_get_tasks_batches_parent_lookups(self):
+        """Test that get_tasks only fetches parents missing from the task list, each once"""
+        listed_parent = {
+            "id": "listed-parent",
+            "name": "Listed Parent",
+            "bookable": False,
+            "end_date": None,
+            "parent_task": None
+        }
+        unlisted_parent = {
+            "id": "unlisted-parent",
+            "name": "Unlisted Parent",
+            "bookable": True,
+            "end_date": self.past_date.isoformat(),
+            "parent_task": None
+        }
+        mock_tasks = [listed_parent] + [
+            {
+                "id": f"child-{index}",
+                "name": f"Child Task {index}",
+                "bookable": True,
+                "end_date": None,
+                "parent_task": {"id": parent["id"], "name": parent["name"]}
+            }
+            for index, parent in enumerate([listed_parent, unlisted_parent] * 3)
+        ]
+
+        with patch.object(self.api, '_request_paginated', return_value=mock_tasks), \
+             patch.object(self.api, '_request', return_value=unlisted_parent) as mock_request:
+
+            result = self.api.get_tasks(active_only=True)
+
+        # The listed parent comes from the task list; the unlisted one is fetched once
+        mock_request.assert_called_once_with("GET", "/tasks/unlisted-parent")
+        self.assertEqual([task["id"] for task in result], ["listed-parent", "child-0", "child-2", "child-4"])
+
     def test_parent_task_cache_handles_api_errors_correctly(self):
         """Test that caching doesn't interfere with error handling"""
         child_task = {
@@ -7,11 +7,6 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import pytz
-import sys
-import os
-
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from timr_utils import UIProjectTime, ProjectTimeConsolidator
 from timr_api import TimrApiError
@@ -1,14 +1,27 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pytz
 import logging
-from config import API_BASE_URL, COMPANY_ID
+from config import API_BASE_URL, API_TIMEOUT, COMPANY_ID
 from datetime import timedelta
 from error_handler import timr_api_error_handler, ErrorCategory, ErrorSeverity, ErrorContext
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections per host; also bounds concurrent parent task fetches
+_POOL_MAXSIZE = 8
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value):
+    """Parse an ISO 8601 timestamp from the API, accepting a Z suffix; results are cached."""
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 def _calculate_ongoing_working_time_end_for_api(working_time, work_start):
     """
@@ -64,21 +77,39 @@ class TimrApi:
     - Comprehensive error handling and logging
     """
 
-    def __init__(self, company_id=COMPANY_ID):
+    def __init__(self, company_id=COMPANY_ID, session=None, timeout=API_TIMEOUT):
         """
         Initialize the TimrApi client.
 
         Args:
             company_id (str): The company ID for Timr.com. Defaults to value from config.
+            session (requests.Session, optional): Session to send requests with, e.g. to
+                share a connection pool between clients. A new session is created if omitted.
+            timeout (float or tuple, optional): Request timeout in seconds, or a
+                (connect, read) tuple. Defaults to value from config.
         """
         self.company_id = company_id
         self.base_url = API_BASE_URL
         self.token = None
         self.token_expiry = None
         self.user = None
-        self.session = requests.Session()
+        if session is None:
+            # Keep-alive connection pool; idempotent requests are retried on connection
+            # and gateway errors, but not after a read timeout: the server may have
+            # applied the request already, and the timeout has to surface as such
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=Retry(total=2, read=False, backoff_factor=0.2,
+                                  status_forcelist=[502, 503, 504], raise_on_status=False)))
+        self.session = session
+        self.timeout = timeout
         # Cache for parent task data during a single get_tasks operation
         self._parent_task_cache = {}
+        # IDs of tasks whose own and ancestors' end dates were already checked
+        self._known_bookable_ids = set()
+        self._known_closed_ids = set()
 
     def _request(self, method, endpoint, data=None, params=None, headers=None):
         """
@@ -120,7 +151,8 @@ class TimrApi:
                 url=url,
                 data=json.dumps(data) if data else None,
                 params=params,
-                headers=headers)
+                headers=headers,
+                timeout=self.timeout)
 
             logger.debug(f"Response status: {response.status_code}")
 
@@ -403,7 +435,7 @@ class TimrApi:
                 return dt
             # If it has time component, extract the date part
             if 'T' in dt:
-                return dt.split('T')[0]
+                return dt.partition('T')[0]
             # Otherwise, return as is
             return dt
 
@@ -419,11 +451,12 @@ class TimrApi:
     def _format_datetime_iso8601(self, dt):
         """Format a datetime in ISO 8601 format with timezone offset as required by Timr API."""
         if isinstance(dt, str):
+            # Replace Z with +00:00 to ensure consistent timezone offset format
+            if dt.endswith('Z') and 'T' in dt:
+                return dt[:-1] + '+00:00'
+
             # If string already has timezone info, use as is
-            if '+' in dt or (dt.endswith('Z') and 'T' in dt):
-                # Replace Z with +00:00 to ensure consistent timezone offset format
-                if dt.endswith('Z'):
-                    return dt.replace('Z', '+00:00')
+            if '+' in dt:
                 return dt
 
             # If it's a date only string, add time and timezone
@@ -431,33 +464,21 @@ class TimrApi:
                 return f"{dt}T00:00:00+00:00"
 
             # If it has time component without timezone, add timezone
-            if 'T' in dt and not ('+' in dt or dt.endswith('Z')):
+            if 'T' in dt and not dt.endswith('Z'):
                 return f"{dt}+00:00"
 
             # Otherwise return as is
             return dt
 
-        # Handle datetime objects
+        # Handle datetime objects; isoformat() always renders UTC as +00:00
         if isinstance(dt, datetime.datetime):
-            # Ensure timezone info is present
             if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=pytz.UTC)
-
-            # Format to ISO 8601 with timezone offset
-            iso_format = dt.isoformat()
-
-            # Replace Z suffix with +00:00 if needed
-            if iso_format.endswith('Z'):
-                return iso_format.replace('Z', '+00:00')
-
-            return iso_format
+                dt = dt.replace(tzinfo=datetime.timezone.utc)
+            return dt.isoformat()
 
         # If it's a date object, convert to datetime at start of day
         if isinstance(dt, datetime.date):
-            dt = datetime.datetime.combine(dt,
-                                           datetime.time.min,
-                                           tzinfo=pytz.UTC)
-            return dt.isoformat()
+            return f"{dt.isoformat()}T00:00:00+00:00"
 
         # If we can't handle it, convert to string
         return str(dt)
@@ -651,21 +672,73 @@ class TimrApi:
 
         # Filter active tasks if requested
         if active_only:
-            # Clear parent task cache for this get_tasks operation
-            self._parent_task_cache = {}
+            # Start this get_tasks operation's parent cache with the listed tasks,
+            # which usually include the parents, and fetch the missing ones up front
+            self._parent_task_cache = {task["id"]: task for task in all_tasks if task.get("id")}
+            self._known_bookable_ids = set()
+            self._known_closed_ids = set()
+            self._prefetch_parent_tasks(all_tasks)
             active_tasks = []
+            now = datetime.datetime.now(pytz.UTC)
 
             for task in all_tasks:
                 # Use the new comprehensive filtering that checks parent tasks too
-                if self._is_task_effectively_bookable(task):
+                if self._is_task_effectively_bookable(task, now):
                     active_tasks.append(task)
 
-            # Clear cache after filtering is complete
+            # Clear caches after filtering is complete
             self._parent_task_cache = {}
+            self._known_bookable_ids = set()
+            self._known_closed_ids = set()
             return active_tasks
 
         return all_tasks
 
+    def _prefetch_parent_tasks(self, tasks):
+        """
+        Fill the parent task cache with all ancestors of the given tasks.
+
+        Ancestors missing from the cache are fetched one hierarchy level at a time,
+        with the requests of a level running concurrently.
+
+        Args:
+            tasks (list): Task entries whose ancestors should be cached
+        """
+        pending = self._uncached_parent_ids(tasks)
+        while pending:
+            fetched = self._get_tasks_by_ids(pending)
+            pending = self._uncached_parent_ids(fetched.values())
+
+    def _uncached_parent_ids(self, tasks):
+        """Return the IDs of the tasks' parents that are not in the parent task cache."""
+        parent_ids = {(task.get("parent_task") or {}).get("id") for task in tasks}
+        return {parent_id for parent_id in parent_ids
+                if parent_id and parent_id not in self._parent_task_cache}
+
+    def _get_tasks_by_ids(self, task_ids):
+        """
+        Fetch several tasks concurrently, through the parent task cache.
+
+        The API has no bulk lookup by ID, so one request per task is sent over the
+        pooled session. Tasks that can't be fetched are left out and not cached.
+
+        Args:
+            task_ids (set): Task IDs to fetch
+
+        Returns:
+            dict: Task data by task ID
+        """
+        tasks = {}
+        with ThreadPoolExecutor(max_workers=min(_POOL_MAXSIZE, len(task_ids))) as pool:
+            futures = {pool.submit(self._get_task_by_id, task_id): task_id for task_id in task_ids}
+            for future in as_completed(futures):
+                task_id = futures[future]
+                try:
+                    tasks[task_id] = future.result()
+                except TimrApiError as e:
+                    logger.debug(f"Could not prefetch task {task_id}: {e}")
+        return tasks
+
     def _get_task_by_id(self, task_id):
         """
         Get a specific task by its ID, with caching support.
@@ -692,42 +765,54 @@ class TimrApi:
             # Don't cache API errors - always retry failed requests
             raise
 
-    def _is_task_effectively_bookable(self, task):
+    def _is_task_effectively_bookable(self, task, now=None):
         """
         Check if a task is effectively bookable by verifying that both the task
         and all its parent tasks are not closed (don't have past end_dates).
         
         Args:
             task (dict): Task data to check
+            now (datetime, optional): Current time for comparison; pass it when
+                checking many tasks. Defaults to the current UTC time.
             
         Returns:
             bool: True if task is effectively bookable, False otherwise
         """
-        now = datetime.datetime.now(pytz.UTC)
-        
-        # Check the task itself first
-        if not self._is_task_active(task, now):
+        if now is None:
+            now = datetime.datetime.now(pytz.UTC)
+
+        task_id = task.get("id")
+        if task_id in self._known_closed_ids:
             return False
-            
-        # Check parent tasks recursively
+        if task_id in self._known_bookable_ids:
+            return True
+
+        # Walk up the hierarchy until a closed task, the root or an already checked ancestor
+        checked_ids = []
         current_task = task
-        while current_task and current_task.get('parent_task'):
-            parent_info = current_task.get('parent_task')
-            parent_id = parent_info.get('id')
-            
-            if not parent_id:
+        while True:
+            if current_task.get("id"):
+                checked_ids.append(current_task["id"])
+            if not self._is_task_active(current_task, now):
+                self._known_closed_ids.update(checked_ids)
+                return False
+
+            parent_id = (current_task.get("parent_task") or {}).get("id")
+            if not parent_id or parent_id in self._known_bookable_ids:
                 break
-                
+            if parent_id in self._known_closed_ids:
+                self._known_closed_ids.update(checked_ids)
+                return False
+
             try:
-                parent_task = self._get_task_by_id(parent_id)
-                if not self._is_task_active(parent_task, now):
-                    return False
-                current_task = parent_task
-            except TimrApiError as e:
+                current_task = self._get_task_by_id(parent_id)
+            except TimrApiError:
                 # If we can't fetch the parent task, assume it's active
-                # to avoid blocking tasks due to temporary API issues
-                break
-                
+                # to avoid blocking tasks due to temporary API issues;
+                # nothing is remembered so that the next check retries
+                return True
+
+        self._known_bookable_ids.update(checked_ids)
         return True
         
     def _is_task_active(self, task, now):
@@ -954,39 +1039,38 @@ class TimrApi:
             list: Project times within the working time
         """
         try:
-            # Parse the start time
-            work_start = datetime.datetime.fromisoformat(
-                work_time_entry["start"].replace("Z", "+00:00"))
-            
-            # Handle ongoing working times (null end time)
+            work_start = _parse_iso(work_time_entry["start"])
+        except (KeyError, ValueError, AttributeError, TypeError):
+            logger.warning(f"Working time without a valid start: {work_time_entry!r:.200}")
+            return []
+
+        try:
+            # Ongoing working times (null end) are queried up to today, so their
+            # end only has to be calculated when there is something to filter
             work_end_str = work_time_entry.get("end")
-            if work_end_str is None:
-                # For ongoing working times, use calculated end time
-                work_end = _calculate_ongoing_working_time_end_for_api(work_time_entry, work_start)
-                logger.info(f"Using calculated end time for ongoing working time: {work_end}")
+            work_end = _parse_iso(work_end_str) if work_end_str is not None else None
+            if work_end is not None:
+                end_date = work_end.date()
             else:
-                # Standard working time with end time
-                work_end = datetime.datetime.fromisoformat(
-                    work_end_str.replace("Z", "+00:00"))
-
-            # Format dates for API query
-            start_date = work_start.date()
-            end_date = work_end.date()
+                end_date = max(work_start.date(), datetime.datetime.now(pytz.UTC).date())
 
-            # Get all project times for this date range
             project_times = self.get_project_times(
-                start_date=start_date,
+                start_date=work_start.date(),
                 end_date=end_date,
                 user_id=self.user.get("id") if self.user else None)
+            if not project_times:
+                return []
+
+            if work_end is None:
+                work_end = _calculate_ongoing_working_time_end_for_api(work_time_entry, work_start)
+                logger.info(f"Using calculated end time for ongoing working time: {work_end}")
 
             # Filter to only those within this working time
             project_times_in_working_time = []
             for pt in project_times:
                 try:
-                    pt_start = datetime.datetime.fromisoformat(
-                        pt.get("start", "").replace("Z", "+00:00"))
-                    pt_end = datetime.datetime.fromisoformat(
-                        pt.get("end", "").replace("Z", "+00:00"))
+                    pt_start = _parse_iso(pt.get("start", ""))
+                    pt_end = _parse_iso(pt.get("end", ""))
 
                     # Check if project time overlaps with working time
                     if ((pt_start >= work_start and pt_start < work_end)